@@ -0,0 +1,156 @@
+# === asset_cache.py ===
+import json
+import os
+import pygame
+from collision import shapes_for
+
+# Process-wide sprite cache shared by every Enemy, Bullet and Missile.
+# Keys are (path, frame count, size, rotation, scale ratio, flip) and values are
+# immutable tuples, so every instance of a type shares the same surfaces.
+_frames = {}
+_masks = {}
+_shapes = {}
+
+# Hit/miss counters (frames and masks combined)
+stats = {"hits": 0, "misses": 0}
+
+# Prebuilt sprite atlas (see build_atlas.py)
+ATLAS_DIR = "atlas"
+ATLAS_INDEX = os.path.join(ATLAS_DIR, "sprites.json")
+ATLAS_VERSION = 1
+
+
+def _slice_sheet(path, count, size, rotation, scale_ratio, flip_x):
+    # Slice frames from sprite sheet, then scale and rotate each one
+    sheet = pygame.image.load(path).convert_alpha()
+    frame_width = sheet.get_width() // count
+    frame_height = sheet.get_height()
+    frames = []
+    for i in range(count):
+        frame = pygame.Surface((frame_width, frame_height), pygame.SRCALPHA)
+        frame.blit(sheet, (0, 0), (i * frame_width,
+                   0, frame_width, frame_height))
+        if size is not None:
+            scaled_size = (
+                int(size[0] * scale_ratio), int(size[1] * scale_ratio))
+            frame = pygame.transform.scale(frame, scaled_size)
+        if rotation:
+            frame = pygame.transform.rotate(frame, rotation)
+        if flip_x:
+            frame = pygame.transform.flip(frame, True, False)
+        frames.append(frame)
+    return tuple(frames)
+
+
+def get_frames(path, count, size=None, rotation=0, scale_ratio=1.0, flip_x=False):
+    # Return the shared frame tuple for a sheet, slicing it on first use
+    key = (path, count, size, rotation, scale_ratio, flip_x)
+    frames = _frames.get(key)
+    if frames is None:
+        stats["misses"] += 1
+        frames = _slice_sheet(
+            path, count, size, rotation, scale_ratio, flip_x)
+        _frames[key] = frames
+    else:
+        stats["hits"] += 1
+    return frames
+
+
+def get_masks(path, count, size=None, rotation=0, scale_ratio=1.0, flip_x=False):
+    # Return collision masks matching get_frames() for the same key
+    key = (path, count, size, rotation, scale_ratio, flip_x)
+    masks = _masks.get(key)
+    if masks is None:
+        stats["misses"] += 1
+        frames = get_frames(path, count, size, rotation, scale_ratio, flip_x)
+        masks = tuple(pygame.mask.from_surface(frame) for frame in frames)
+        _masks[key] = masks
+    else:
+        stats["hits"] += 1
+    return masks
+
+
+def get_shapes(path, count, size=None, rotation=0, scale_ratio=1.0, flip_x=False):
+    # Return hit shapes (tight rect, coarse and full mask) for the same key
+    key = (path, count, size, rotation, scale_ratio, flip_x)
+    shapes = _shapes.get(key)
+    if shapes is None:
+        stats["misses"] += 1
+        shapes = shapes_for(get_masks(path, count, size, rotation, scale_ratio, flip_x))
+        _shapes[key] = shapes
+    else:
+        stats["hits"] += 1
+    return shapes
+
+
+def get_image(path, size=None, rotation=0):
+    # Single (unsliced) image
+    return get_frames(path, 1, size, rotation)[0]
+
+
+def get_mask(path, size=None, rotation=0):
+    return get_masks(path, 1, size, rotation)[0]
+
+
+def get_shape(path, size=None, rotation=0):
+    return get_shapes(path, 1, size, rotation)[0]
+
+
+def frame_sets():
+    # Every cached frame set by key (what build_atlas.py packs)
+    return dict(_frames)
+
+
+def source_stamp(path):
+    # Size and mtime of a source sheet, recorded in the atlas index
+    st = os.stat(path)
+    return [st.st_size, int(st.st_mtime)]
+
+# === Atlas ===
+
+
+def load_atlas(index_path=ATLAS_INDEX):
+    # Seed the cache with subsurfaces of one packed, pre-rotated and pre-scaled
+    # atlas image. Returns False (loading nothing) when there is no atlas or it
+    # is out of date with its source sheets; those then load the slow way
+    if not os.path.exists(index_path):
+        return False
+    with open(index_path) as f:
+        index = json.load(f)
+    if index.get("version") != ATLAS_VERSION:
+        return False
+    for path, stamp in index["sources"].items():
+        if not os.path.exists(path) or source_stamp(path) != stamp:
+            return False
+
+    atlas = pygame.image.load(os.path.join(
+        os.path.dirname(index_path), index["image"])).convert_alpha()
+    for entry in index["sets"]:
+        path, count, size, rotation, scale_ratio, flip_x = entry["key"]
+        key = (path, count, tuple(size) if size else None, rotation, scale_ratio, flip_x)
+        _frames[key] = tuple(atlas.subsurface(rect) for rect in entry["rects"])
+    return True
+
+
+def cache_stats():
+    # Snapshot of counters plus number of cached entries
+    return {
+        "hits": stats["hits"],
+        "misses": stats["misses"],
+        "frame_sets": len(_frames),
+        "mask_sets": len(_masks),
+        "shape_sets": len(_shapes),
+    }
+
+
+def reset_stats():
+    stats["hits"] = 0
+    stats["misses"] = 0
+
+
+def clear():
+    # Drop all cached surfaces (e.g. after the display mode changes)
+    _frames.clear()
+    _masks.clear()
+    _shapes.clear()
+    reset_stats()
@@ -0,0 +1,125 @@
+# === background.py ===
+import threading
+import pygame
+import game_clock
+
+# Constants
+WINDOW_WIDTH, WINDOW_HEIGHT = 1280, 720
+FRAME_WIDTH, FRAME_HEIGHT = 64, 64
+FRAMES_PER_SHEET = 4
+FPS = 2  # 2 frames per second
+BG_SWITCH_INTERVAL_SEC = 120  # switch every 2 minutes
+PREFETCH_LEAD_SEC = 30  # start loading the next background this long before the switch
+
+# === Background Handler ===
+
+
+class BackgroundAnimator:
+    # Only the current and the next background are resident: the next one is
+    # loaded on a worker thread ahead of the switch, older ones are evicted.
+    # Frames are kept at their native 64x64 and scaled into one reusable
+    # opaque full-screen buffer when the animation frame changes (2 FPS)
+    def __init__(self, sprite_paths):
+        self.paths = list(sprite_paths)
+        self.resident = {}  # background index -> native frames
+        self._loading = {}  # background index -> worker thread
+        self._lock = threading.Lock()
+
+        self.current_bg_index = 0
+        self.current_frame_index = 0
+        self.last_frame_time = game_clock.now()
+        self.last_bg_switch_time = game_clock.now()
+        self.frames = self.display_frames(0)
+
+        # Opaque display-format surfaces blit much faster than per-pixel alpha
+        self.buffer = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT)).convert()
+        self._buffer_key = None  # frame_key() the buffer currently shows
+
+    def load_frames_from_sheet(self, path):
+        # Runs on the worker thread, so nothing is converted to the display
+        # format here (see display_frames)
+        sheet = pygame.image.load(path)
+        frames = []
+        for i in range(FRAMES_PER_SHEET):
+            frame = pygame.Surface(
+                (FRAME_WIDTH, FRAME_HEIGHT), pygame.SRCALPHA)
+            frame.blit(sheet, (0, 0), (i * FRAME_WIDTH,
+                       0, FRAME_WIDTH, FRAME_HEIGHT))
+            frames.append(frame)
+        return frames
+
+    def display_frames(self, index):
+        # Native frames in the (opaque) buffer format, as transform.scale
+        # into an existing surface requires matching formats
+        return [frame.convert() for frame in self.frames_for(index)]
+
+    # === Residency ===
+
+    def next_index(self, index):
+        return (index + 1) % len(self.paths)
+
+    def prefetch(self, index):
+        # Start loading a background in the background (no-op if resident)
+        if index in self.resident or index in self._loading:
+            return
+        worker = threading.Thread(target=self._load, args=(index,), daemon=True)
+        self._loading[index] = worker
+        worker.start()
+
+    def _load(self, index):
+        frames = self.load_frames_from_sheet(self.paths[index])
+        with self._lock:
+            self.resident[index] = frames
+
+    def frames_for(self, index):
+        # Frames of a background, waiting for (or doing) the load if needed
+        worker = self._loading.pop(index, None)
+        if worker is not None:
+            worker.join()
+        with self._lock:
+            if index not in self.resident:
+                self.resident[index] = self.load_frames_from_sheet(self.paths[index])
+            return self.resident[index]
+
+    def evict(self, keep):
+        with self._lock:
+            for index in list(self.resident):
+                if index not in keep:
+                    del self.resident[index]
+
+    # === Animation ===
+
+    def update(self, now):
+        # Frame animation
+        if now - self.last_frame_time >= 1 / FPS:
+            self.current_frame_index = (self.current_frame_index + 1) % FRAMES_PER_SHEET
+            self.last_frame_time = now
+
+        # Load the next background ahead of the switch
+        upcoming = self.next_index(self.current_bg_index)
+        if now - self.last_bg_switch_time >= BG_SWITCH_INTERVAL_SEC - PREFETCH_LEAD_SEC:
+            self.prefetch(upcoming)
+
+        # Background switching
+        if now - self.last_bg_switch_time >= BG_SWITCH_INTERVAL_SEC:
+            self.current_bg_index = upcoming
+            self.frames = self.display_frames(upcoming)
+            self.evict({upcoming})
+            self.current_frame_index = 0
+            self.last_bg_switch_time = now
+
+    def current_surface(self):
+        # Re-scale into the buffer only when the drawn frame changed
+        key = self.frame_key()
+        if key != self._buffer_key:
+            pygame.transform.scale(
+                self.frames[self.current_frame_index], (WINDOW_WIDTH, WINDOW_HEIGHT), self.buffer)
+            self._buffer_key = key
+        return self.buffer
+
+    def frame_key(self):
+        # Changes whenever the drawn background changes
+        return self.current_bg_index, self.current_frame_index
+
+    def draw(self, surface):
+        surface.blit(self.current_surface(), (0, 0))
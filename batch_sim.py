@@ -0,0 +1,138 @@
+# === batch_sim.py ===
+import argparse
+import itertools
+import json
+import multiprocessing
+import os
+import time
+import headless
+import stats_logger as statistics
+
+# Constants
+OUTPUT_CSV = "simulated_gamedata.csv"  # same schema as gamedata.csv
+SIM_START_TIME = 0.0  # fixed simulated epoch so seeds reproduce exactly
+
+# === Parameter Grid ===
+# Keys: "spawn_weights", "<EnemyName>.<field>" (any ENEMY_TYPES field) and
+# "difficulty.<step>" (any DIFFICULTY_STEP key); values are lists to sweep.
+
+
+def parse_seeds(text):
+    # "0:100" -> range(0, 100), "7" -> [7]
+    if ":" in text:
+        start, stop = text.split(":", 1)
+        return list(range(int(start), int(stop)))
+    return [int(text)]
+
+
+def expand_grid(grid):
+    # Cartesian product of every swept key -> list of flat param dicts
+    keys = sorted(grid)
+    return [dict(zip(keys, values)) for values in itertools.product(*(grid[k] for k in keys))]
+
+
+def session_kwargs(params):
+    # Flat grid params -> GameSession keyword arguments
+    kwargs = {"enemy_overrides": {}, "difficulty": {}}
+    for key, value in params.items():
+        if key == "spawn_weights":
+            kwargs["spawn_weights"] = value
+        elif key.startswith("difficulty."):
+            kwargs["difficulty"][key.split(".", 1)[1]] = value
+        else:
+            name, field = key.split(".", 1)
+            kwargs["enemy_overrides"].setdefault(name, {})[field] = value
+    return kwargs
+
+# === Worker ===
+
+
+def run_job(job):
+    combo, params, seed, max_time, tick_rate = job
+    stats = headless.run_session(max_time=max_time, tick_rate=tick_rate, log=False,
+                                 start_time=SIM_START_TIME, seed=seed,
+                                 session_id=f"sim_c{combo}_s{seed}", **session_kwargs(params))
+    return combo, seed, statistics.make_row(**stats)
+
+
+def run_batch(combos, seeds, max_time, tick_rate, workers=None):
+    # Sessions are independent, so fan them out over a process pool
+    jobs = [(combo, params, seed, max_time, tick_rate)
+            for combo, params in enumerate(combos) for seed in seeds]
+    # spawn (not fork): SDL state from the parent must not leak into workers
+    context = multiprocessing.get_context("spawn")
+    workers = workers or os.cpu_count()
+    # About four chunks per worker: few round trips, but no worker left idle
+    # while another still holds a long tail of sessions
+    chunksize = max(1, len(jobs) // (workers * 4))
+    with context.Pool(workers, initializer=headless.init_headless) as pool:
+        results = list(pool.imap_unordered(run_job, jobs, chunksize=chunksize))
+    results.sort(key=lambda r: (r[0], r[1]))
+    return results
+
+
+def summarize(combos, results):
+    # Mean score / survival / kills per parameter combination
+    summary = []
+    for combo, params in enumerate(combos):
+        rows = [row for c, _, row in results if c == combo]
+        summary.append({
+            "combo": combo,
+            "params": params,
+            "sessions": len(rows),
+            "mean_score": sum(r["Score"] for r in rows) / len(rows),
+            "mean_survival": sum(r["SurvivalTime"] for r in rows) / len(rows),
+            "mean_kills": sum(r["EnemiesDefeated"] for r in rows) / len(rows),
+        })
+    return summary
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Run headless sessions over a seed range and parameter grid on all cores.")
+    parser.add_argument("--seeds", default="0:100",
+                        help="seed range start:stop (default 0:100)")
+    parser.add_argument("--grid", help="JSON file mapping param keys to value lists")
+    parser.add_argument("--param", action="append", default=[], metavar="KEY=JSON_LIST",
+                        help='e.g. Fighter.health=[20,30] or spawn_weights=[[10,4,3],[5,5,5]]')
+    parser.add_argument("--max-time", type=float, default=headless.MAX_SESSION_SEC)
+    parser.add_argument("--tick-rate", type=int, default=headless.TICK_RATE)
+    parser.add_argument("--workers", type=int, default=None,
+                        help="process count (default: all cores)")
+    parser.add_argument("--out", default=OUTPUT_CSV,
+                        help="stats file to append to (.db/.sqlite: SQLite, see stats_db.py)")
+    parser.add_argument("--summary", help="write per-combination summary JSON here")
+    args = parser.parse_args(argv)
+
+    grid = {}
+    if args.grid:
+        with open(args.grid) as f:
+            grid.update(json.load(f))
+    for item in args.param:
+        key, values = item.split("=", 1)
+        grid[key] = json.loads(values)
+
+    combos = expand_grid(grid)
+    seeds = parse_seeds(args.seeds)
+    if not seeds:
+        parser.error(f"--seeds {args.seeds} is an empty range")
+    if not combos:
+        parser.error("the parameter grid has an empty value list")
+    started = time.perf_counter()
+    results = run_batch(combos, seeds, args.max_time, args.tick_rate, args.workers)
+    elapsed = time.perf_counter() - started
+
+    statistics.append_rows(args.out, [row for _, _, row in results])
+    summary = summarize(combos, results)
+    for entry in summary:
+        print(f"c{entry['combo']} {entry['params']}: score {entry['mean_score']:.0f}, "
+              f"survival {entry['mean_survival']:.1f}s, kills {entry['mean_kills']:.1f}")
+    print(f"{len(results)} sessions in {elapsed:.1f}s "
+          f"({len(results) * 60 / elapsed:.1f} sessions/min) -> {args.out}")
+    if args.summary:
+        with open(args.summary, "w") as f:
+            json.dump(summary, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,252 @@
+# === benchmark.py ===
+import headless  # noqa: F401  (selects the dummy SDL drivers before pygame starts)
+
+import argparse
+import itertools
+import json
+import platform
+import random
+import statistics
+import subprocess
+import time
+import numpy as np
+import pygame
+import asset_cache
+import game_clock
+from enemy import Enemy, ENEMY_TYPES, preload_enemy_assets
+from game_manager import GameSession, WINDOW_WIDTH, WINDOW_HEIGHT
+from background import BackgroundAnimator
+from timestep import TICK_DT
+
+# Constants
+SEED = 1234  # every scenario is laid out from this seed
+BACKGROUND_PATHS = [f"GIF_2FPS/space{i}_4-frames.png" for i in range(1, 10)]
+
+# Scenario presets: live enemies, enemy projectiles and player bullets on screen
+PRESETS = {
+    "early_game": {"enemies": 3, "projectiles": 12, "bullets": 15, "shotgun": False},
+    "minute_10": {"enemies": 20, "projectiles": 200, "bullets": 40, "shotgun": False},
+    "shotgun_spam": {"enemies": 10, "projectiles": 60, "bullets": 250, "shotgun": True},
+}
+# Bullet-vs-enemy collision densities: (enemies, bullets)
+COLLISION_DENSITIES = [(5, 50), (20, 200), (40, 500)]
+
+# === Timing ===
+
+
+def measure(fn, number, repeat):
+    # Microseconds per call over `repeat` timed runs of `number` calls each
+    runs = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for _ in range(number):
+            fn()
+        runs.append((time.perf_counter() - started) / number * 1e6)
+    return summarize(runs, number)
+
+
+def measure_ticks(setup, step, ticks, repeat):
+    # Per-tick cost of step(state) over a fresh setup() for each run
+    runs = []
+    for _ in range(repeat):
+        state = setup()
+        started = time.perf_counter()
+        for _ in range(ticks):
+            step(state)
+        runs.append((time.perf_counter() - started) / ticks * 1e6)
+    return summarize(runs, ticks)
+
+
+def summarize(runs, number):
+    return {
+        "median_us": statistics.median(runs),
+        "min_us": min(runs),
+        "mean_us": statistics.fmean(runs),
+        "stdev_us": statistics.stdev(runs) if len(runs) > 1 else 0.0,
+        "number": number,
+        "repeat": len(runs),
+    }
+
+# === Scenarios ===
+
+
+def make_session(enemies, projectiles, bullets, shotgun=False, seed=SEED):
+    # A session frozen mid-game: enemies spread over the playfield, projectiles
+    # and bullets in flight, and a shield that never expires so nothing ends it
+    clock = game_clock.FrameClock(0.0)
+    game_clock.set_source(clock)
+    session = GameSession(seed=seed, verbose=False)
+    layout = random.Random(seed)
+
+    player = session.player
+    player.shield_active = True
+    player.shield_duration = float("inf")
+    player.firing = shotgun
+    if shotgun:
+        session.active_powerups["shotgun"] = float("inf")
+
+    for i in range(enemies):
+        enemy = session.enemy_pool.acquire(
+            ENEMY_TYPES[i % len(ENEMY_TYPES)], session.rng, session.projectiles)
+        enemy.place(layout.randint(300, WINDOW_WIDTH - enemy.rect.width),
+                    layout.randint(0, WINDOW_HEIGHT - enemy.rect.height))
+        enemy.health = 10 ** 9  # keep the density constant while measuring
+        enemy.speed = 0
+        session.enemies.append(enemy)
+
+    owners = list(session.projectiles.type_ids.values())
+    for i in range(projectiles):
+        session.projectiles.spawn(owners[i % len(owners)], layout.uniform(0, WINDOW_WIDTH),
+                                  layout.uniform(0, WINDOW_HEIGHT), -layout.uniform(120, 360),
+                                  layout.uniform(-60, 60), clock())
+    for _ in range(bullets):
+        session.bullets.spawn((layout.uniform(0, WINDOW_WIDTH - 100),
+                               layout.uniform(20, WINDOW_HEIGHT - 20)), clock())
+    return clock, session
+
+
+def session_step(update):
+    def step(state):
+        clock, session = state
+        clock.advance(TICK_DT)
+        update(session, clock())
+    return step
+
+
+def scenario_setup(preset):
+    return lambda: make_session(**PRESETS[preset])
+
+# === Benchmarks ===
+
+
+def bench_construction(repeat):
+    results = {}
+    session = make_session(0, 0, 0)[1]
+    pool = session.projectiles
+    types = itertools.cycle(ENEMY_TYPES)
+    rng = random.Random(SEED)
+    results["enemy_construct"] = measure(
+        lambda: Enemy(next(types), rng, pool), 200, repeat)
+
+    def cold_enemy():
+        asset_cache.clear()
+        Enemy(ENEMY_TYPES[0], rng, pool)
+    results["enemy_construct_cold"] = measure(cold_enemy, 5, repeat)
+
+    results["bullet_spawn"] = measure(
+        lambda: session.bullets.spawn((100, 100), 0.0), 500, repeat)
+    preload_enemy_assets()  # restore the warm cache the cold benchmark dropped
+    return results
+
+
+def bench_preset(preset, ticks, repeat):
+    setup = scenario_setup(preset)
+    screen = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
+
+    def draw_enemies(session, now):
+        for enemy in session.enemies:
+            enemy.draw(screen)
+        session.projectiles.draw(screen)
+
+    def update_enemies(session, now):
+        session.update_enemies(TICK_DT, now)
+        session.update_projectiles(TICK_DT, now)
+
+    steps = {
+        "enemy_update": update_enemies,
+        "enemy_draw": draw_enemies,
+        "bullet_collision": lambda s, now: s.update_bullets(TICK_DT, now),
+        "full_update": lambda s, now: s.update(0, 0, s.player.firing, TICK_DT),
+        "full_draw": lambda s, now: s.draw(screen),
+        "hud_draw": lambda s, now: s.draw_hud(screen, now),
+    }
+    return {f"{preset}.{name}": measure_ticks(setup, session_step(step), ticks, repeat)
+            for name, step in steps.items()}
+
+
+def bench_collision(ticks, repeat):
+    results = {}
+    for enemies, bullets in COLLISION_DENSITIES:
+        results[f"collision.e{enemies}_b{bullets}"] = measure_ticks(
+            lambda: make_session(enemies, 0, bullets),
+            session_step(lambda s, now: s.update_bullets(TICK_DT, now)), ticks, repeat)
+    return results
+
+
+def bench_background(repeat):
+    return {"background_load": measure(lambda: BackgroundAnimator(BACKGROUND_PATHS), 1, repeat)}
+
+# === Report ===
+
+
+def git_commit():
+    try:
+        commit = subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True,
+                                text=True, check=True).stdout.strip()
+        dirty = subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"],
+                               capture_output=True, text=True).stdout.strip()
+        return commit + ("-dirty" if dirty else "")
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def metadata(args):
+    return {
+        "commit": git_commit(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "pygame": pygame.version.ver,
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "ticks": args.ticks,
+        "repeat": args.repeat,
+    }
+
+
+def print_report(results, baseline=None):
+    for name, stats in results.items():
+        line = f"{name:<36}{stats['median_us']:>12.1f} us"
+        if baseline and name in baseline:
+            line += f"   x{stats['median_us'] / baseline[name]['median_us']:.2f} vs baseline"
+        print(line)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Benchmark the game loop hot paths (dummy SDL driver, fixed seed).")
+    parser.add_argument("--preset", action="append", choices=sorted(PRESETS),
+                        help="scenario preset to run (repeatable, default: all)")
+    parser.add_argument("--ticks", type=int, default=120, help="ticks per timed run")
+    parser.add_argument("--repeat", type=int, default=5, help="timed runs per benchmark")
+    parser.add_argument("--skip-background", action="store_true",
+                        help="skip the (slow) background sheet load benchmark")
+    parser.add_argument("--out", help="write results as JSON here")
+    parser.add_argument("--compare", metavar="JSON",
+                        help="print ratios against an earlier --out file")
+    args = parser.parse_args(argv)
+
+    headless.init_headless()
+    results = {}
+    try:
+        results.update(bench_construction(args.repeat))
+        for preset in args.preset or PRESETS:
+            results.update(bench_preset(preset, args.ticks, args.repeat))
+        results.update(bench_collision(args.ticks, args.repeat))
+        if not args.skip_background:
+            results.update(bench_background(args.repeat))
+    finally:
+        game_clock.reset()
+
+    baseline = None
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)["results"]
+    print_report(results, baseline)
+    if args.out:
+        with open(args.out, "w") as f:
+            json.dump({"meta": metadata(args), "results": results}, f, indent=2)
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+# === broadphase.py ===
+
+# Constants
+WINDOW_WIDTH, WINDOW_HEIGHT = 1280, 720
+CELL_SIZE = 128  # 10 x 6 cells over the playfield
+
+# === Uniform Grid Broadphase ===
+
+
+class SpatialGrid:
+    def __init__(self, width=WINDOW_WIDTH, height=WINDOW_HEIGHT, cell_size=CELL_SIZE):
+        self.cell_size = cell_size
+        self.cols = (width + cell_size - 1) // cell_size
+        self.rows = (height + cell_size - 1) // cell_size
+        self.cells = {}  # (col, row) -> item indices
+        self.items = []  # (item, rect) in insertion order
+
+        # Pairs that reached the narrow phase vs. pairs rejected early
+        self.pairs_tested = 0
+        self.pairs_culled = 0
+
+    def _cell_range(self, rect):
+        # Cells covered by rect, clamped so off-screen rects use edge cells
+        size = self.cell_size
+        c0 = min(max(rect.left // size, 0), self.cols - 1)
+        c1 = min(max((rect.right - 1) // size, 0), self.cols - 1)
+        r0 = min(max(rect.top // size, 0), self.rows - 1)
+        r1 = min(max((rect.bottom - 1) // size, 0), self.rows - 1)
+        return c0, c1, r0, r1
+
+    def clear(self):
+        for bucket in self.cells.values():
+            bucket.clear()
+        self.items.clear()
+
+    def insert(self, item, rect):
+        index = len(self.items)
+        self.items.append((item, rect))
+        c0, c1, r0, r1 = self._cell_range(rect)
+        for col in range(c0, c1 + 1):
+            for row in range(r0, r1 + 1):
+                self.cells.setdefault((col, row), []).append(index)
+
+    def rebuild(self, items):
+        # Rebuild from objects exposing .rect (called once per tick)
+        self.clear()
+        for item in items:
+            self.insert(item, item.rect)
+
+    def query(self, rect):
+        # Items whose rect intersects rect, in insertion order
+        c0, c1, r0, r1 = self._cell_range(rect)
+        hits = set()
+        for col in range(c0, c1 + 1):
+            for row in range(r0, r1 + 1):
+                for index in self.cells.get((col, row), ()):
+                    if index not in hits and self.items[index][1].colliderect(rect):
+                        hits.add(index)
+        self.pairs_tested += len(hits)
+        self.pairs_culled += len(self.items) - len(hits)
+        return [self.items[index][0] for index in sorted(hits)]
+
+    def check(self, rect_a, rect_b):
+        # Single rect pre-check (e.g. one player vs. one projectile), counted
+        if rect_a.colliderect(rect_b):
+            self.pairs_tested += 1
+            return True
+        self.pairs_culled += 1
+        return False
+
+    def record(self, tested, culled):
+        # Counts from an external prefilter (e.g. the vectorized projectile pool)
+        self.pairs_tested += tested
+        self.pairs_culled += culled
+
+    def stats(self):
+        total = self.pairs_tested + self.pairs_culled
+        return {
+            "pairs_tested": self.pairs_tested,
+            "pairs_culled": self.pairs_culled,
+            "cull_ratio": self.pairs_culled / total if total else 0,
+        }
+
+    def reset_stats(self):
+        self.pairs_tested = 0
+        self.pairs_culled = 0
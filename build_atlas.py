@@ -0,0 +1,99 @@
+# === build_atlas.py ===
+import headless  # noqa: F401  (selects the dummy SDL drivers before pygame starts)
+
+import argparse
+import json
+import os
+import time
+import pygame
+import asset_cache
+from enemy import preload_enemy_assets
+from player import preload_player_assets
+
+# Constants
+ATLAS_WIDTH = 4096  # packed image width; height grows to fit
+PADDING = 1  # transparent pixels between sprites
+
+# === Packing ===
+
+
+def collect():
+    # Slice every sheet exactly as the game does (same cache keys, already
+    # rotated, scaled and flipped), starting from an empty cache
+    asset_cache.clear()
+    preload_enemy_assets()
+    preload_player_assets()
+    return asset_cache.frame_sets()
+
+
+def pack(sizes, width=ATLAS_WIDTH):
+    # Shelf packing, tallest first: returns a position per size and the height
+    order = sorted(range(len(sizes)), key=lambda i: (-sizes[i][1], -sizes[i][0]))
+    positions = [None] * len(sizes)
+    x = y = shelf_height = 0
+    for i in order:
+        w, h = sizes[i]
+        if w > width:
+            raise ValueError(f"sprite {w}x{h} is wider than the {width}px atlas")
+        if x + w > width:
+            x, y = 0, y + shelf_height + PADDING
+            shelf_height = 0
+        positions[i] = (x, y)
+        x += w + PADDING
+        shelf_height = max(shelf_height, h)
+    return positions, y + shelf_height
+
+
+def build(out_dir=asset_cache.ATLAS_DIR, width=ATLAS_WIDTH):
+    sets = collect()
+    keys = list(sets)
+    frames = [frame for key in keys for frame in sets[key]]
+    positions, height = pack([frame.get_size() for frame in frames], width)
+
+    # BLEND_RGBA_MAX onto a cleared surface copies pixels (alpha included)
+    # exactly instead of alpha-blending them
+    atlas = pygame.Surface((width, height), pygame.SRCALPHA)
+    atlas.fill((0, 0, 0, 0))
+    entries = []
+    i = 0
+    for key in keys:
+        rects = []
+        for frame in sets[key]:
+            atlas.blit(frame, positions[i], special_flags=pygame.BLEND_RGBA_MAX)
+            rects.append([*positions[i], *frame.get_size()])
+            i += 1
+        entries.append({"key": list(key), "rects": rects})
+
+    os.makedirs(out_dir, exist_ok=True)
+    image_name = "sprites.png"
+    pygame.image.save(atlas, os.path.join(out_dir, image_name))
+    index = {
+        "version": asset_cache.ATLAS_VERSION,
+        "image": image_name,
+        "size": [width, height],
+        "sources": {path: asset_cache.source_stamp(path) for path in sorted({k[0] for k in keys})},
+        "sets": entries,
+    }
+    with open(os.path.join(out_dir, "sprites.json"), "w") as f:
+        json.dump(index, f, indent=1)
+    return len(keys), len(frames), (width, height)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Pack every enemy and player sprite (pre-rotated and scaled) into one atlas.")
+    parser.add_argument("--out", default=asset_cache.ATLAS_DIR)
+    parser.add_argument("--width", type=int, default=ATLAS_WIDTH)
+    args = parser.parse_args(argv)
+
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    started = time.perf_counter()
+    sets, frames, (width, height) = build(args.out, args.width)
+    print(f"{sets} frame sets, {frames} frames -> {args.out}/sprites.png "
+          f"({width}x{height}) in {time.perf_counter() - started:.2f}s")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+# === collision.py ===
+import numpy as np
+import pygame
+
+# Constants
+COARSE_CELL = 8  # pixels per coarse mask bit (each side)
+
+# === Hit Shapes ===
+
+
+def mask_bits(mask):
+    # Mask as a (width, height) bool array
+    return pygame.surfarray.array_red(mask.to_surface()) > 0
+
+
+def tight_bounds(bits):
+    # Smallest rect around the set pixels (empty rect if none); computed here
+    # because Mask.get_bounding_rects() crashes on one-pixel-wide masks
+    cols = np.flatnonzero(bits.any(axis=1))
+    rows = np.flatnonzero(bits.any(axis=0))
+    if not len(cols):
+        return pygame.Rect(0, 0, 0, 0)
+    return pygame.Rect(int(cols[0]), int(rows[0]),
+                       int(cols[-1] - cols[0] + 1), int(rows[-1] - rows[0] + 1))
+
+
+def downsample(bits, cell=COARSE_CELL):
+    # Coarse mask with one bit per cell x cell block, set if any pixel in the
+    # block is set (so it never misses an overlap the full mask would find)
+    width, height = bits.shape
+    cols, rows = -(-width // cell), -(-height // cell)
+    padded = np.zeros((cols * cell, rows * cell), dtype=bool)
+    padded[:width, :height] = bits
+    blocks = padded.reshape(cols, cell, rows, cell).any(axis=(1, 3))
+    coarse = pygame.Mask((cols, rows))
+    for col, row in zip(*np.nonzero(blocks)):
+        coarse.set_at((int(col), int(row)))
+    return coarse
+
+
+def spread(coarse):
+    # Coarse mask grown by one cell right and down: a cell of a sprite at an
+    # offset that is not a multiple of the cell size straddles up to two
+    # cells of the other sprite's grid on each axis
+    width, height = coarse.get_size()
+    grown = pygame.Mask((width + 1, height + 1))
+    for offset in ((0, 0), (1, 0), (0, 1), (1, 1)):
+        grown.draw(coarse, offset)
+    return grown
+
+
+class HitShape:
+    # Collision levels for one sprite frame: the tight rect around its set
+    # pixels (frame-local), a coarse mask and the full mask
+    __slots__ = ("mask", "bounds", "coarse", "coarse_spread")
+
+    def __init__(self, mask):
+        self.mask = mask
+        bits = mask_bits(mask)
+        self.bounds = tight_bounds(bits)
+        self.coarse = downsample(bits)
+        self.coarse_spread = spread(self.coarse)
+
+
+def shapes_for(masks):
+    return tuple(HitShape(mask) for mask in masks)
+
+# === Hit Test ===
+
+
+def overlap(a, a_pos, b, b_pos):
+    # True if shapes a and b, drawn with their top-left corners at a_pos and
+    # b_pos, share a set pixel. Tests the tight rects, then the coarse masks,
+    # and only then the full masks
+    dx = b_pos[0] - a_pos[0]
+    dy = b_pos[1] - a_pos[1]
+    if not a.bounds.colliderect(b.bounds.move(dx, dy)):
+        return False
+    if not a.coarse.overlap(b.coarse_spread, (dx // COARSE_CELL, dy // COARSE_CELL)):
+        return False
+    return a.mask.overlap(b.mask, (dx, dy)) is not None
@@ -1,8 +1,10 @@
 # === enemy.py ===
-import pygame
 import random
-import time
 import math
+import asset_cache
+import game_clock
+from timestep import interpolate
+from projectile_pool import ProjectilePool, MOVING, TRACKING
 
 # Constants
 WINDOW_WIDTH = 1280
@@ -17,10 +19,10 @@ ENEMY_TYPES = [
         "weaponAnimation": "Enemy/EnemyShipAsset/Weapons/Fighter.png",
         "projectile": "Enemy/EnemyShipAsset/Projectiles/Bolt.png",
         "destroyed": "Enemy/EnemyShipAsset/Destroyed/Fighter.png",
-        "speed": 3,
+        "speed": 180,  # pixels per second
         "size": (192, 192),
         "health": 20,
-        "projectile_speed": 5,
+        "projectile_speed": 300,  # pixels per second
         "score": 100,
         "weapon_frames": 28,
         "projectile_frames": 5,
@@ -33,10 +35,10 @@ ENEMY_TYPES = [
         "weaponAnimation": "Enemy/EnemyShipAsset/Weapons/Torpedo.png",
         "projectile": "Enemy/EnemyShipAsset/Projectiles/Torpedo.png",
         "destroyed": "Enemy/EnemyShipAsset/Destroyed/Torpedo.png",
-        "speed": 2.5,
+        "speed": 150,
         "size": (192, 192),
         "health": 30,
-        "projectile_speed": 4,
+        "projectile_speed": 240,
         "score": 150,
         "weapon_frames": 12,
         "projectile_frames": 3,
@@ -49,10 +51,10 @@ ENEMY_TYPES = [
         "weaponAnimation": "Enemy/EnemyShipAsset/Weapons/Battlecruiser.png",
         "projectile": "Enemy/EnemyShipAsset/Projectiles/Rocket.png",
         "destroyed": "Enemy/EnemyShipAsset/Destroyed/Battlecruiser.png",
-        "speed": 1.8,
+        "speed": 108,
         "size": (240, 240),
         "health": 50,
-        "projectile_speed": 3,
+        "projectile_speed": 180,
         "score": 200,
         "weapon_frames": 9,
         "projectile_frames": 4,
@@ -63,13 +65,47 @@ ENEMY_TYPES = [
 # Higher number = higher spawn chance
 SPAWN_WEIGHTS = [10, 4, 3]  # fighter, torpedo, battlecruiser
 
+# Sprite orientation / layout shared by all enemy types
+ENEMY_ROTATION = 90
+ENGINE_FRAMES = 8
+PROJECTILE_SCALE = 0.25
+DESTROYED_FRAME_COUNTS = {"Fighter": 18, "Torpedo": 16, "Battlecruiser": 18}
+TORPEDO_SWAY = 120  # peak vertical speed of the torpedo's sine path (pixels per second)
+
+
+def preload_enemy_assets(enemy_types=ENEMY_TYPES):
+    # Bake every enemy type's frames and hit shapes into the asset cache once,
+    # so spawning an Enemy later is only a handful of cache hits
+    for data in enemy_types:
+        size = data["size"]
+        asset_cache.get_shape(data["path"], size, ENEMY_ROTATION)
+        asset_cache.get_frames(
+            data["weaponAnimation"], data["weapon_frames"], size, ENEMY_ROTATION)
+        for flip_x in (False, True):
+            asset_cache.get_shapes(
+                data["projectile"], data["projectile_frames"], size, ENEMY_ROTATION, PROJECTILE_SCALE, flip_x)
+        asset_cache.get_frames(
+            data["engine"], ENGINE_FRAMES, size, ENEMY_ROTATION)
+        asset_cache.get_frames(
+            data["destroyed"], DESTROYED_FRAME_COUNTS.get(data["name"], 16), size, ENEMY_ROTATION)
+
 # === Enemy Class ===
 
 
 class Enemy:
-    def __init__(self):
-        # Choose enemy type based on weighted random
-        data = random.choices(ENEMY_TYPES, weights=SPAWN_WEIGHTS, k=1)[0]
+    def __init__(self, data=None, rng=random, projectiles=None):
+        self.reset(data, rng, projectiles)
+
+    def reset(self, data=None, rng=random, projectiles=None):
+        # (Re)initialise for a new spawn; pooled enemies reuse the instance
+        # Per-session RNG (random.Random) keeps seeded runs reproducible
+        self.rng = rng
+        # Shared projectile pool (projectiles outlive the enemy that fired them)
+        self.projectile_pool = projectiles if projectiles is not None else ProjectilePool()
+
+        # Choose enemy type based on weighted random (unless given)
+        if data is None:
+            data = rng.choices(ENEMY_TYPES, weights=SPAWN_WEIGHTS, k=1)[0]
         self.data = data
         self.speed = data["speed"]
         self.size = data["size"]
@@ -82,16 +118,25 @@ class Enemy:
         self.weapon_frames = self.load_frames(
             data["weaponAnimation"], data["weapon_frames"])
         self.projectile_frames = self.load_frames(
-            data["projectile"], data["projectile_frames"], scale_ratio=0.25)
-        self.engine_frames = self.load_frames(data["engine"], 8)
+            data["projectile"], data["projectile_frames"], scale_ratio=PROJECTILE_SCALE)
+        # Rightward projectiles use pre-flipped frames; every frame has a
+        # precomputed hit shape so collision is a lookup plus an overlap test
+        self.projectile_frames_flipped = self.load_frames(
+            data["projectile"], data["projectile_frames"], scale_ratio=PROJECTILE_SCALE, flip_x=True)
+        self.projectile_shapes = self.load_shapes(
+            data["projectile"], data["projectile_frames"], scale_ratio=PROJECTILE_SCALE)
+        self.projectile_shapes_flipped = self.load_shapes(
+            data["projectile"], data["projectile_frames"], scale_ratio=PROJECTILE_SCALE, flip_x=True)
+        self.engine_frames = self.load_frames(data["engine"], ENGINE_FRAMES)
         self.destroyed_frames = self.load_frames(
             data["destroyed"], self.get_destroyed_frame_count())
 
-        # Setup position and collision mask
+        # Setup position and hit shape (tight rect, coarse and full mask)
         self.rect = self.base_image.get_rect()
-        self.rect.x = WINDOW_WIDTH + random.randint(0, 300)
-        self.rect.y = random.randint(50, WINDOW_HEIGHT - self.size[1])
-        self.mask = pygame.mask.from_surface(self.base_image)
+        self.place(WINDOW_WIDTH + self.rng.randint(0, 300),
+                   self.rng.randint(50, WINDOW_HEIGHT - self.size[1]))
+        self.shape = asset_cache.get_shape(
+            data["path"], self.size, ENEMY_ROTATION)
 
         # Engine animation state
         self.current_engine_frame = 0
@@ -105,11 +150,17 @@ class Enemy:
         self.is_firing = False
 
         # Projectile logic
-        self.projectiles = []
-        self.projectile_lifetime = 3  # Time before it stops tracking
+        self.projectile_type = self.projectile_pool.register(
+            data["name"], self.projectile_frames, self.projectile_shapes,
+            self.projectile_frames_flipped, self.projectile_shapes_flipped)
+
+        # Fighter patrol direction (picked on first update)
+        self.vertical_direction = None
+        self.vertical_timer = 0
 
         # Destroyed animation state
         self.destroyed = False
+        self.powerup_dropped = False
         self.destruction_finished = False
         self.current_destroyed_frame = 0
         self.destroyed_fps = 30
@@ -117,51 +168,44 @@ class Enemy:
 
         # Fire delay tracking
         self.last_fire_time = 0
-        self.spawn_time = time.time()
-        self.sine_offset = random.uniform(0, 2 * math.pi)
+        self.spawn_time = game_clock.now()
+        self.sine_offset = self.rng.uniform(0, 2 * math.pi)
+
+    def place(self, x, y):
+        # Float top-left position (rect is its rounded copy for collision);
+        # prev_x/prev_y hold the last step's position for interpolation
+        self.x = self.prev_x = x
+        self.y = self.prev_y = y
+        self.rect.topleft = (round(x), round(y))
 
     def get_destroyed_frame_count(self):
         # Return number of explosion frames
-        name = self.data["name"]
-        if name == "Fighter":
-            return 18
-        if name == "Torpedo":
-            return 16
-        if name == "Battlecruiser":
-            return 18
-        return 16
+        return DESTROYED_FRAME_COUNTS.get(self.data["name"], 16)
 
     def load_image(self, path):
-        # Load and rotate enemy base image
-        img = pygame.image.load(path).convert_alpha()
-        img = pygame.transform.scale(img, self.size)
-        return pygame.transform.rotate(img, 90)
-
-    def load_frames(self, path, count, scale_ratio=1.0):
-        # Slice frames from sprite sheet
-        sheet = pygame.image.load(path).convert_alpha()
-        frame_width = sheet.get_width() // count
-        frame_height = sheet.get_height()
-        frames = []
-        for i in range(count):
-            frame = pygame.Surface(
-                (frame_width, frame_height), pygame.SRCALPHA)
-            frame.blit(sheet, (0, 0), (i * frame_width,
-                       0, frame_width, frame_height))
-            scaled_size = (
-                int(self.size[0] * scale_ratio), int(self.size[1] * scale_ratio))
-            frame = pygame.transform.scale(frame, scaled_size)
-            frame = pygame.transform.rotate(frame, 90)
-            frames.append(frame)
-        return frames
-
-    def update(self, player):
-        # Update behavior every frame
-        now = time.time()
+        # Shared, pre-scaled and rotated enemy base image
+        return asset_cache.get_image(path, self.size, ENEMY_ROTATION)
+
+    def load_frames(self, path, count, scale_ratio=1.0, flip_x=False):
+        # Shared frame tuple sliced from sprite sheet
+        return asset_cache.get_frames(path, count, self.size, ENEMY_ROTATION, scale_ratio, flip_x)
+
+    def load_shapes(self, path, count, scale_ratio=1.0, flip_x=False):
+        # Shared hit shapes matching load_frames()
+        return asset_cache.get_shapes(path, count, self.size, ENEMY_ROTATION, scale_ratio, flip_x)
+
+    def fire_projectile(self, x, y, vx, vy, now, state=MOVING):
+        self.projectile_pool.spawn(
+            self.projectile_type, x, y, vx, vy, now, state)
+
+    def update(self, player, dt, now):
+        # Advance one fixed step of dt seconds; now is the step's game time
+        self.prev_x, self.prev_y = self.x, self.y
 
         if not self.destroyed:
             # Move enemy to the left
-            self.rect.x -= self.speed
+            self.x -= self.speed * dt
+            self.rect.x = round(self.x)
 
             # Fighter moves randomly up/down and fires forward
             if self.data["name"] == "Fighter":
@@ -176,57 +220,41 @@ class Enemy:
                         self.last_weapon_update = now
 
                         if self.weapon_frame_index == 4:
-                            self.projectiles.append({
-                                "x": self.rect.centerx,
-                                "y": self.rect.centery,
-                                "angle": 0,
-                                "vx": -self.projectile_speed,
-                                "vy": 0,
-                                "start_time": now,
-                                "frame": 0,
-                                "frame_timer": now,
-                                "state": "moving"
-                            })
+                            self.fire_projectile(
+                                self.rect.centerx, self.rect.centery, -self.projectile_speed, 0, now)
 
                         if self.weapon_frame_index >= len(self.weapon_frames):
                             self.is_firing = False
                             self.last_fire_time = now
 
-                if not hasattr(self, 'vertical_direction'):
-                    self.vertical_direction = random.choice([-1, 1])
+                if self.vertical_direction is None:
+                    self.vertical_direction = self.rng.choice([-1, 1])
                     self.vertical_timer = now
 
-                if now - self.vertical_timer > random.uniform(1, 3):
+                if now - self.vertical_timer > self.rng.uniform(1, 3):
                     self.vertical_direction *= -1
                     self.vertical_timer = now
 
-                self.rect.y += self.vertical_direction * self.speed
+                self.y += self.vertical_direction * self.speed * dt
 
-                if self.rect.top < 0:
-                    self.rect.top = 0
+                if self.y < 0:
+                    self.y = 0
                     self.vertical_direction = 1
-                elif self.rect.bottom > WINDOW_HEIGHT:
-                    self.rect.bottom = WINDOW_HEIGHT
+                elif self.y > WINDOW_HEIGHT - self.rect.height:
+                    self.y = WINDOW_HEIGHT - self.rect.height
                     self.vertical_direction = -1
+                self.rect.y = round(self.y)
 
             # Torpedo moves in sine wave
             elif self.data["name"] == "Torpedo":
                 t = now - self.spawn_time
-                self.rect.y += math.sin(t * 4 + self.sine_offset) * 2
+                self.y += math.sin(t * 4 + self.sine_offset) * TORPEDO_SWAY * dt
+                self.rect.y = round(self.y)
 
                 # Fire downward projectile every 5 seconds
                 if now - self.last_fire_time > self.data["fire_delay"]:
-                    self.projectiles.append({
-                        "x": self.rect.centerx,
-                        "y": self.rect.bottom,
-                        "angle": math.pi / 2,
-                        "vx": 0,
-                        "vy": self.projectile_speed,
-                        "start_time": now,
-                        "frame": 0,
-                        "frame_timer": now,
-                        "state": "moving"
-                    })
+                    self.fire_projectile(
+                        self.rect.centerx, self.rect.bottom, 0, self.projectile_speed, now)
                     self.last_fire_time = now
 
             # Battlecruiser shooting logic
@@ -253,34 +281,17 @@ class Enemy:
                         dx = player.rect.centerx - self.rect.centerx
                         dy = player.rect.centery - self.rect.centery
                         angle = math.atan2(dy, dx)
-                        self.projectiles.append({
-                            "x": self.rect.centerx,
-                            "y": self.rect.centery,
-                            "angle": angle,
-                            "vx": math.cos(angle) * self.projectile_speed,
-                            "vy": math.sin(angle) * self.projectile_speed,
-                            "start_time": now,
-                            "frame": 0,
-                            "frame_timer": now,
-                            "state": "tracking"
-                        })
+                        self.fire_projectile(
+                            self.rect.centerx, self.rect.centery,
+                            math.cos(angle) * self.projectile_speed,
+                            math.sin(angle) * self.projectile_speed, now, TRACKING)
 
                     # End of firing animation
                     if self.weapon_frame_index >= len(self.weapon_frames):
                         self.is_firing = False
                         self.last_fire_time = now
 
-            # Update all projectiles
-            for p in self.projectiles:
-                if p["state"] == "tracking" and now - p["start_time"] > self.projectile_lifetime:
-                    p["state"] = "moving"
-
-                p["x"] += p["vx"]
-                p["y"] += p["vy"]
-
-                if now - p["frame_timer"] > 0.1:
-                    p["frame"] = (p["frame"] + 1) % len(self.projectile_frames)
-                    p["frame_timer"] = now
+            # Projectiles are advanced by the shared pool (ProjectilePool.update)
 
         elif not self.destruction_finished:
             # Update explosion animation
@@ -291,30 +302,26 @@ class Enemy:
                     self.health = 0
                 self.last_destroyed_update = now
 
-    def draw(self, surface):
+    def draw(self, surface, alpha=1.0):
+        # Drawn between the last two steps (alpha = fraction of a step)
+        pos = (round(interpolate(self.prev_x, self.x, alpha)),
+               round(interpolate(self.prev_y, self.y, alpha)))
+
         # Draw engine effect
         if not self.destroyed:
             surface.blit(
-                self.engine_frames[self.current_engine_frame], self.rect)
+                self.engine_frames[self.current_engine_frame], pos)
 
             # Draw weapon animation if firing
             if self.is_firing:
                 surface.blit(self.weapon_frames[self.weapon_frame_index % len(
-                    self.weapon_frames)], self.rect)
+                    self.weapon_frames)], pos)
             else:
-                surface.blit(self.base_image, self.rect)
+                surface.blit(self.base_image, pos)
         elif not self.destruction_finished:
             # Draw explosion animation
             surface.blit(
-                self.destroyed_frames[self.current_destroyed_frame], self.rect)
-
-        # Draw all projectiles
-        for p in self.projectiles:
-            img = self.projectile_frames[p["frame"]]
-            if p["vx"] > 0:
-                img = pygame.transform.flip(img, True, False)
-            rect = img.get_rect(center=(p["x"], p["y"]))
-            surface.blit(img, rect)
+                self.destroyed_frames[self.current_destroyed_frame], pos)
 
     def take_damage(self, dmg):
         # Subtract health and trigger destruction if zero
@@ -327,7 +334,7 @@ class Enemy:
         # Start explosion animation
         self.destroyed = True
         self.current_destroyed_frame = -1
-        self.last_destroyed_update = time.time() - (1 / self.destroyed_fps)
+        self.last_destroyed_update = float("-inf")  # first explosion frame on the next update
 
     def is_off_screen(self):
         # Check if enemy should be removed
@@ -0,0 +1,46 @@
+# === game_clock.py ===
+import time
+
+# Every entity reads the time through now(), so the wall clock can be
+# swapped for a FrameClock (interactive loop, headless runs, replay)
+_source = time.time
+
+
+def now():
+    return _source()
+
+
+def set_source(source):
+    # source is any zero-argument callable returning seconds
+    global _source
+    _source = source
+
+
+def reset():
+    # Back to wall-clock time
+    set_source(time.time)
+
+# === Frame Clock ===
+
+
+class FrameClock:
+    # Game time that only moves when advance() is called: once per fixed step
+    # in the interactive loop, or by a fixed dt in simulated (headless/replay)
+    # runs. Every entity in a step therefore reads the same time, and a
+    # paused game does not drift
+    def __init__(self, start=0.0, scale=1.0):
+        self.time = start
+        self.scale = scale  # game seconds per real second (<1 slow-mo, >1 fast-forward)
+        self.paused = False
+
+    def frame_ms(self, real_ms):
+        # Game milliseconds a rendered frame of real_ms is worth
+        if self.paused:
+            return 0
+        return round(real_ms * self.scale)
+
+    def advance(self, dt):
+        self.time += dt
+
+    def __call__(self):
+        return self.time
@@ -1,346 +1,460 @@
 # === game_manager.py ===
+import os
 import pygame
 import time
 import random
 import math
-from player import PlayerShip, Bullet, Missile
-from enemy import Enemy
-from powerup import PowerUp
+import game_clock
+import asset_cache
+from player import PlayerShip, BulletManager, Missile, BULLET_SPEED
+from enemy import Enemy, ENEMY_TYPES, SPAWN_WEIGHTS, preload_enemy_assets
+from powerup import PowerUp, roll_drop
+from background import BackgroundAnimator
+from broadphase import SpatialGrid
+from collision import overlap
+from object_pool import ObjectPool
+from projectile_pool import ProjectilePool
 import stats_logger as statistics
+from replay import InputRecorder, encode_keys, decode_keys
+from renderer import DirtyRectRenderer
+from hud import HUD, TextCache
+from profiler import Profiler, NullProfiler
+from telemetry import TelemetryWriter, NullTelemetry, KINDS, WEAPONS, DAMAGE_SOURCES, POWERUP_NAMES
+from timestep import FixedTimestep, TICK_DT
 
 pygame.font.init()
 score_font = pygame.font.SysFont("Arial", 32)
 
 # Constants
 WINDOW_WIDTH, WINDOW_HEIGHT = 1280, 720
-FRAME_WIDTH, FRAME_HEIGHT = 64, 64
-FPS = 2  # 2 frames per second
-BG_SWITCH_INTERVAL_SEC = 120  # switch every 2 minutes
-
-# === Background Handler ===
-
-
-class BackgroundAnimator:
-    def __init__(self, sprite_paths):
-        self.frames = [self.load_frames_from_sheet(
-            path) for path in sprite_paths]
-        self.current_bg_index = 0
-        self.current_frame_index = 0
-        self.last_frame_time = time.time()
-        self.last_bg_switch_time = time.time()
-
-    def load_frames_from_sheet(self, path):
-        sheet = pygame.image.load(path).convert_alpha()
-        frames = []
-        for i in range(4):
-            frame = pygame.Surface(
-                (FRAME_WIDTH, FRAME_HEIGHT), pygame.SRCALPHA)
-            frame.blit(sheet, (0, 0), (i * FRAME_WIDTH,
-                       0, FRAME_WIDTH, FRAME_HEIGHT))
-            frame = pygame.transform.scale(
-                frame, (WINDOW_WIDTH, WINDOW_HEIGHT))
-            frames.append(frame)
-        return frames
-
-    def update(self):
-        now = time.time()
-        # Frame animation
-        if now - self.last_frame_time >= 1 / FPS:
-            self.current_frame_index = (self.current_frame_index + 1) % 4
-            self.last_frame_time = now
-        # Background switching
-        if now - self.last_bg_switch_time >= BG_SWITCH_INTERVAL_SEC:
-            self.current_bg_index = (
-                self.current_bg_index + 1) % len(self.frames)
-            self.current_frame_index = 0
-            self.last_bg_switch_time = time.time()
-
-    def draw(self, surface):
-        surface.blit(self.frames[self.current_bg_index]
-                     [self.current_frame_index], (0, 0))
-
-# === Main Game Setup ===
-
-def log_session(player, score, start_time):
-    session_id = f"session_{int(start_time)}"
-    distance = player.total_distance
+MAX_FRAME_MS = 250  # longest frame the simulation steps over (hitches, window drags)
+RENDER_FPS = 60  # render rate cap (game rules always step at timestep.LOGIC_HZ)
+TIME_SCALES = (0.25, 0.5, 1.0, 2.0, 4.0)  # slow-mo / fast-forward steps (- and = keys)
+
+# Per-minute difficulty increments (GameSession difficulty= overrides these)
+DIFFICULTY_STEP = {
+    "health": 0.1,  # enemy health multiplier
+    "speed": 0.05,  # enemy speed multiplier
+    "fire_delay": 0.02,  # player fire cooldown multiplier (decrease)
+    "spawn_delay": 0.1,  # seconds removed from the spawn delay
+    "projectile_speed": 0.0,  # enemy projectile speed multiplier
+}
+
+# === Session Stats ===
+
+def session_stats(player, score, start_time, session_id=None):
+    # Aggregates written to gamedata.csv (shared by interactive and headless runs)
+    survival_time = int(game_clock.now() - start_time)
     shots_fired = player.total_shots
     shots_hit = player.shots_hit
     powerups_used = player.powerups_collected
-    survival_time = int(time.time() - start_time)
     enemies_defeated = player.enemies_killed
 
-    edpm = enemies_defeated * 60 / survival_time if survival_time > 0 else 0
-    accuracy_per_min = (shots_hit / shots_fired * 100) if shots_fired > 0 else 0
-    powerup_effectiveness = score / powerups_used if powerups_used > 0 else 0
-
-    statistics.log_stats(
-        session_id, distance, shots_fired, shots_hit,
-        powerups_used, survival_time, enemies_defeated, score,
-        edpm=edpm, accuracy_per_min=accuracy_per_min,
-        powerup_effectiveness=powerup_effectiveness
-    )
-
-
-
-def main():
-    pygame.init()
-    screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
-    pygame.display.set_caption("Platypus Out of Clay")
-    clock = pygame.time.Clock()
-
-    # Load background animator
-    sprite_sheet_files = [
-        f"GIF_2FPS/space{i}_4-frames.png" for i in range(1, 10)]
-    background = BackgroundAnimator(sprite_sheet_files)
-
-    # Create player (spawned near left side, vertically centered)
-    player = PlayerShip((WINDOW_WIDTH // 12, WINDOW_HEIGHT // 2))
-
-    # Bullet tracking
-    bullets = []
-    enemies = []  # Enemy list
-    powerups = []  # Power-up list
-    missiles = []  # Missile list
-    active_powerups = {}  # effect -> end_time
-
-    last_shot_time = 0
-    last_shotgun_time = 0
-    fire_delay = 0.25  # 0.3 seconds between bullets
-    firerate_multiplier = 1.0  # 1.0x fire rate
-    shotgun_fire_delay = 0.6  # slower than regular
-    enemy_spawn_delay = 2  # Spawn delay for enemies
-    last_enemy_spawn = time.time()
-    score = 0
-    game_over = False
-
-    # Timer
-    start_time = time.time()
-    blink = False
-    blink_start = 0
-    blink_duration = 0.3
-    last_minute_triggered = -1
-
-    # Dificulty notification
-    difficulty_msg_timer = 0
-    difficulty_msg_duration = 2  # seconds
-    show_difficulty_msg = False
-
-    # Dynamic scaling factors
-    enemy_health_multiplier = 1.0
-    enemy_speed_multiplier = 1.0
-    fire_delay_multiplier = 1.0
-    enemy_projectile_speed_multiplier = 1.0  # 1.0x speed
-
-    # Game loop
-    running = True
-    while running:
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT or (event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE):
-                log_session(player, score, start_time)
-                running = False
-        # Player movement using WASD
-        keys = pygame.key.get_pressed()
-        dx = dy = 0
-        if keys[pygame.K_a]:
-            dx = -1
-        if keys[pygame.K_d]:
-            dx = 1
-        if keys[pygame.K_w]:
-            dy = -1
-        if keys[pygame.K_s]:
-            dy = 1
-        player.move(dx, dy)
+    return {
+        "session_id": session_id or f"session_{int(start_time)}",
+        "distance": player.total_distance,
+        "shots_fired": shots_fired,
+        "shots_hit": shots_hit,
+        "powerups_used": powerups_used,
+        "survival_time": survival_time,
+        "enemies_defeated": enemies_defeated,
+        "score": score,
+        "edpm": enemies_defeated * 60 / survival_time if survival_time > 0 else 0,
+        "accuracy_per_min": (shots_hit / shots_fired * 100) if shots_fired > 0 else 0,
+        "powerup_effectiveness": score / powerups_used if powerups_used > 0 else 0,
+    }
+
+
+def log_session(player, score, start_time, session_id=None):
+    statistics.log_stats(**session_stats(player, score, start_time, session_id))
+
+# === Game Session (rules, no display or input handling) ===
+
+
+class GameSession:
+    def __init__(self, seed=None, spawn_weights=None, enemy_overrides=None, difficulty=None, verbose=True,
+                 profiler=None, telemetry=None, session_id=None):
+        # Every random decision in the session comes from this seeded RNG
+        self.seed = seed
+        self.rng = random.Random(seed)
+
+        # Balancing knobs: spawn weights, per-type ENEMY_TYPES field overrides
+        # ({"Fighter": {"health": 25}}) and DIFFICULTY_STEP overrides
+        self.spawn_weights = spawn_weights or SPAWN_WEIGHTS
+        enemy_overrides = enemy_overrides or {}
+        self.enemy_types = [dict(data, **enemy_overrides.get(data["name"], {}))
+                            for data in ENEMY_TYPES]
+        self.difficulty_step = dict(DIFFICULTY_STEP, **(difficulty or {}))
+        self.verbose = verbose
+        self.profiler = profiler or NullProfiler()  # per-subsystem frame timings
+        self.telemetry = telemetry or NullTelemetry()  # per-tick gameplay events
+        self.tick = 0  # fixed steps taken (telemetry timestamps)
+        self.enemy_type_ids = {data["name"]: i for i, data in enumerate(self.enemy_types)}
+
+        # Create player (spawned near left side, vertically centered)
+        self.player = PlayerShip((WINDOW_WIDTH // 12, WINDOW_HEIGHT // 2))
+
+        # Bullet tracking
+        self.bullets = BulletManager(self.player.auto_cannon_bullet_path)
+        self.enemies = []  # Enemy list
+        self.powerups = []  # Power-up list
+        self.missiles = []  # Missile list
+        self.projectiles = ProjectilePool()  # every enemy projectile, as arrays
+
+        # Free-list pools so steady-state play reuses instances
+        self.enemy_pool = ObjectPool(Enemy)
+        self.missile_pool = ObjectPool(Missile)
+        self.powerup_pool = ObjectPool(PowerUp)
+        self.active_powerups = {}  # effect -> end_time
+        self.collision_grid = SpatialGrid()  # enemy broadphase, rebuilt every tick
+
+        self.last_shot_time = 0
+        self.last_shotgun_time = 0
+        self.fire_delay = 0.25  # 0.3 seconds between bullets
+        self.firerate_multiplier = 1.0  # 1.0x fire rate
+        self.shotgun_fire_delay = 0.6  # slower than regular
+        self.enemy_spawn_delay = 2  # Spawn delay for enemies
+        self.last_enemy_spawn = game_clock.now()
+        self.score = 0
+        self.game_over = False
+        self.hud = None  # created on first draw (headless sessions never render)
+
+        # Timer
+        self.start_time = game_clock.now()
+        # Stats row key; batch runs start many sessions a second and pass their own
+        self.session_id = session_id or f"session_{int(self.start_time)}"
+        self.elapsed = 0
+        self.blink = False
+        self.blink_start = 0
+        self.blink_duration = 0.3
+        self.last_minute_triggered = -1
+
+        # Dificulty notification
+        self.difficulty_msg_timer = 0
+        self.difficulty_msg_duration = 2  # seconds
+        self.show_difficulty_msg = False
+
+        # Dynamic scaling factors
+        self.enemy_health_multiplier = 1.0
+        self.enemy_speed_multiplier = 1.0
+        self.fire_delay_multiplier = 1.0
+        self.enemy_projectile_speed_multiplier = 1.0  # 1.0x speed
+
+    def stats(self):
+        return session_stats(self.player, self.score, self.start_time, self.session_id)
+
+    def log(self):
+        log_session(self.player, self.score, self.start_time, self.session_id)
+
+    def update(self, dx, dy, firing, dt=TICK_DT):
+        # Advance the game rules by one fixed step of dt seconds. The clock
+        # is read once here and every subsystem sees the same time
+        now = game_clock.now()
+        self.tick += 1
+        player = self.player
+        scope = self.profiler.scope
+        with scope("player"):
+            player.move(dx, dy, dt, now)
+            player.update_shield(now)
 
         # Check firing state
-        player.firing = keys[pygame.K_SPACE]
-
+        player.firing = firing
+        with scope("bullets"):
+            self.fire(now)
+            self.update_bullets(dt, now)
+        with scope("missiles"):
+            self.update_missiles(dt, now)
+        with scope("spawning"):
+            self.spawn_enemies(now)
+        with scope("enemies"):
+            self.update_enemies(dt, now)
+        with scope("projectile collision"):
+            self.update_projectiles(dt, now)
+        with scope("power-ups"):
+            self.update_powerups(dt, now)
+        self.update_difficulty(now)
+
+    def fire(self, now):
         # Auto-fire bullets if spacebar is held
-        now = time.time()
+        player = self.player
         base_x = player.rect.centerx + player.rect.width // 2
         base_y = player.rect.centery
 
-        if player.firing:
-            if "shotgun" in active_powerups and active_powerups["shotgun"] > now:
-                if now - last_shotgun_time > shotgun_fire_delay:
-                    # 5-way shotgun spread
-                    spread_angles = [-0.4, -0.2, 0, 0.2, 0.4]
-                    for angle in spread_angles:
-                        vx = math.cos(angle) * 10
-                        vy = math.sin(angle) * 10
-                        bullet = Bullet(
-                            player.auto_cannon_bullet_path, (base_x, base_y))
-                        bullet.speed_x = vx
-                        bullet.speed_y = vy
-                        bullets.append(bullet)
-                    last_shotgun_time = now
-            elif "missile" in active_powerups and active_powerups["missile"] > now:
-                if now - last_shot_time > 1:
-                    missile = Missile(
-                        "playership/MainShipWeapon/Rocket.png", (base_x, base_y), player, enemies)
-                    missiles.append(missile)
-                    last_shot_time = now
-            else:
-                if now - last_shot_time > fire_delay * fire_delay_multiplier * firerate_multiplier:
-
-                    bullet = Bullet(
-                        player.auto_cannon_bullet_path, (base_x, base_y))
-                    bullets.append(bullet)
-                    player.total_shots += 1
-                    last_shot_time = now
-
-        # Update and draw everything
-        background.update()
-        background.draw(screen)
-        player.draw(screen)
-
-        # Update bullets and check collision
-        for bullet in bullets[:]:
-            bullet.update()
-            bullet.draw(screen)
-            if bullet.rect.left > WINDOW_WIDTH or bullet.rect.top < 0 or bullet.rect.bottom > WINDOW_HEIGHT:
-                bullets.remove(bullet)
-                continue
-
-            # Pixel-perfect bullet-enemy collision detection
-            for enemy in enemies:
-                offset = (enemy.rect.x - bullet.rect.x,
-                          enemy.rect.y - bullet.rect.y)
-                if bullet.mask.overlap(enemy.mask, offset):
-                    enemy.take_damage(player.firepower)
-                    player.shots_hit += 1
+        if not player.firing:
+            return
+        if "shotgun" in self.active_powerups and self.active_powerups["shotgun"] > now:
+            if now - self.last_shotgun_time > self.shotgun_fire_delay:
+                # 5-way shotgun spread
+                spread_angles = [-0.4, -0.2, 0, 0.2, 0.4]
+                for angle in spread_angles:
+                    vx = math.cos(angle) * BULLET_SPEED
+                    vy = math.sin(angle) * BULLET_SPEED
+                    self.bullets.spawn((base_x, base_y), now, vx, vy)
+                self.last_shotgun_time = now
+                self.telemetry.record(self.tick, KINDS["shot_fired"], WEAPONS.index("shotgun"),
+                                      len(spread_angles), base_x, base_y)
+        elif "missile" in self.active_powerups and self.active_powerups["missile"] > now:
+            if now - self.last_shot_time > 1:
+                missile = self.missile_pool.acquire(
+                    "playership/MainShipWeapon/Rocket.png", (base_x, base_y), player, self.enemies)
+                self.missiles.append(missile)
+                self.last_shot_time = now
+                self.telemetry.record(self.tick, KINDS["shot_fired"], WEAPONS.index("missile"),
+                                      1, base_x, base_y)
+        else:
+            if now - self.last_shot_time > self.fire_delay * self.fire_delay_multiplier * self.firerate_multiplier:
+
+                self.bullets.spawn((base_x, base_y), now)
+                player.total_shots += 1
+                self.last_shot_time = now
+                self.telemetry.record(self.tick, KINDS["shot_fired"], WEAPONS.index("cannon"),
+                                      1, base_x, base_y)
+
+    def kill_reward(self, enemy):
+        # Score, kill count and power-up drop for a destroyed enemy
+        if not enemy.powerup_dropped:
+            enemy.powerup_dropped = True
+            self.score += enemy.score
+            self.player.enemies_killed += 1
+            selected = roll_drop(self.rng)
+            if selected:
+                self.powerups.append(self.powerup_pool.acquire(
+                    enemy.rect.centerx, enemy.rect.centery, selected))
+                self.telemetry.record(self.tick, KINDS["powerup_dropped"], POWERUP_NAMES.index(selected),
+                                      0, *enemy.rect.center)
+
+    def record_hit(self, enemy, damage, was_destroyed):
+        # Telemetry for a bullet or missile hit (and the kill it caused)
+        type_id = self.enemy_type_ids[enemy.data["name"]]
+        x, y = enemy.rect.center
+        self.telemetry.record(self.tick, KINDS["hit"], type_id, damage, x, y)
+        if enemy.destroyed and not was_destroyed:
+            self.telemetry.record(self.tick, KINDS["enemy_killed"], type_id, enemy.score, x, y)
+
+    def record_damage(self, source, health_before):
+        # Telemetry for damage the player actually took (not shielded)
+        player = self.player
+        if player.health < health_before:
+            self.telemetry.record(self.tick, KINDS["damage_taken"], DAMAGE_SOURCES.index(source),
+                                  player.health, *player.rect.center)
+
+    def update_bullets(self, dt, now):
+        # Rebuild enemy broadphase before bullet/missile collision
+        self.collision_grid.rebuild(self.enemies)
+
+        # Advance all bullets at once (off-screen ones are compacted away)
+        bullets = self.bullets
+        bullets.update(dt, now)
+
+        # Pixel-perfect bullet-enemy collision on broadphase candidates
+        hits = []
+        for i, rect in bullets.live():
+            for enemy in self.collision_grid.query(rect):
+                if overlap(bullets.shape, rect.topleft, enemy.shape, enemy.rect.topleft):
+                    was_destroyed = enemy.destroyed
+                    enemy.take_damage(self.player.firepower)
+                    self.record_hit(enemy, self.player.firepower, was_destroyed)
+                    self.player.shots_hit += 1
                     if enemy.health <= 0 and enemy.destroyed:
-                        if not hasattr(enemy, "powerup_dropped"):
-                            enemy.powerup_dropped = True
-                            score += enemy.score
-                            player.enemies_killed += 1
-                            if random.random() < 0.3:
-                                selected = random.choice(["SG", "IF", "MS"])
-                                powerups.append(
-                                    PowerUp(enemy.rect.centerx, enemy.rect.centery, selected))
-                    bullets.remove(bullet)
+                        self.kill_reward(enemy)
+                    hits.append(i)
                     break  # Bullet hits one enemy only
-
-        # Update missiles and check collision
-        for missile in missiles[:]:
-            missile.update()
-            missile.draw(screen)
+        if hits:
+            bullets.remove(hits)
+
+    def update_missiles(self, dt, now):
+        # Update missiles and check collision; survivors are kept in a new
+        # list instead of removing from the live one
+        survivors = []
+        for missile in self.missiles:
+            missile.update(dt, now)
             if missile.rect.left > WINDOW_WIDTH or missile.rect.top < 0 or missile.rect.bottom > WINDOW_HEIGHT:
-                missiles.remove(missile)
+                self.missile_pool.release(missile)
                 continue
-            for enemy in enemies:
-                offset = (enemy.rect.x - missile.rect.x,
-                          enemy.rect.y - missile.rect.y)
-                if missile.mask.overlap(enemy.mask, offset):
+            for enemy in self.collision_grid.query(missile.rect):
+                if overlap(missile.shape, missile.rect.topleft, enemy.shape, enemy.rect.topleft):
+                    was_destroyed = enemy.destroyed
                     enemy.take_damage(30)
+                    self.record_hit(enemy, 30, was_destroyed)
                     if enemy.health <= 0 and enemy.destroyed:
-                        score += enemy.score
-                    if missile in missiles:
-                        missiles.remove(missile)
+                        self.score += enemy.score
+                    self.missile_pool.release(missile)
                     break
+            else:
+                survivors.append(missile)
+        self.missiles = survivors
+
+    def spawn_enemies(self, now):
         # Spawn new enemies
-        if time.time() - last_enemy_spawn > enemy_spawn_delay:
-            new_enemy = Enemy()
-            new_enemy.health = int(new_enemy.health * enemy_health_multiplier)
-            new_enemy.speed *= enemy_speed_multiplier
-            new_enemy.projectile_speed *= enemy_projectile_speed_multiplier
-            enemies.append(new_enemy)
-            last_enemy_spawn = time.time()
-
-        # Update and draw enemies
-        for enemy in enemies[:]:
-            enemy.update(player)
-            enemy.draw(screen)
+        if now - self.last_enemy_spawn > self.enemy_spawn_delay:
+            data = self.rng.choices(
+                self.enemy_types, weights=self.spawn_weights, k=1)[0]
+            new_enemy = self.enemy_pool.acquire(
+                data, self.rng, self.projectiles)
+            new_enemy.health = int(
+                new_enemy.health * self.enemy_health_multiplier)
+            new_enemy.speed *= self.enemy_speed_multiplier
+            new_enemy.projectile_speed *= self.enemy_projectile_speed_multiplier
+            self.enemies.append(new_enemy)
+            self.last_enemy_spawn = now
+            self.telemetry.record(self.tick, KINDS["enemy_spawned"], self.enemy_type_ids[data["name"]],
+                                  new_enemy.health, *new_enemy.rect.center)
+
+    def update_enemies(self, dt, now):
+        player = self.player
+        grid = self.collision_grid
+
+        # Update enemies
+        survivors = []
+        for enemy in self.enemies:
+            enemy.update(player, dt, now)
 
             # Pixel-perfect collision between player and enemy ship
-            offset = (player.rect.x - enemy.rect.x,
-                      player.rect.y - enemy.rect.y)
-            if enemy.mask.overlap(player.mask, offset):
-                player.take_damage()
+            if grid.check(enemy.rect, player.rect) and overlap(
+                    enemy.shape, enemy.rect.topleft, player.shape, player.rect.topleft):
+                health = player.health
+                player.take_damage(now)
+                self.record_damage("contact", health)
                 if player.health <= 0:
-                    game_over = True
+                    self.game_over = True
 
             if enemy.is_off_screen():
-                enemies.remove(enemy)
-
-            # Pixel-perfect projectile-player collision detection
-            for p in enemy.projectiles[:]:
-                projectile_img = enemy.projectile_frames[p["frame"]]
-                projectile_rect = projectile_img.get_rect(
-                    center=(p["x"], p["y"]))
-                projectile_mask = pygame.mask.from_surface(projectile_img)
-
-                offset = (player.rect.x - projectile_rect.x,
-                          player.rect.y - projectile_rect.y)
-                if projectile_mask.overlap(player.mask, offset):
-                    player.take_damage()
-                    enemy.projectiles.remove(p)
-                    if player.health <= 0:
-                        game_over = True
-
+                self.release_enemy(enemy)
+            else:
+                survivors.append(enemy)
+        self.enemies = survivors
+
+    def update_projectiles(self, dt, now):
+        player = self.player
+
+        # Advance all enemy projectiles at once, then pixel-perfect
+        # projectile-player collision on the pool's rect-filtered candidates
+        self.projectiles.update(now, dt)
+        hits = self.projectiles.collide(player.rect, player.shape, self.collision_grid)
+        for _ in hits:
+            health = player.health
+            player.take_damage(now)
+            self.record_damage("projectile", health)
+            if player.health <= 0:
+                self.game_over = True
+        if hits:
+            self.projectiles.remove(hits)
+
+    def release_enemy(self, enemy):
+        # A pooled enemy will be re-spawned, so missiles must stop tracking it
+        for missile in self.missiles:
+            if missile.target is enemy:
+                missile.target = None
+        self.enemy_pool.release(enemy)
+
+    def update_powerups(self, dt, now):
         # === Power-up update and pickup check ===
-        for pu in powerups[:]:
-            pu.update()
-            pu.draw(screen)
-            offset = (player.rect.x - pu.rect.x, player.rect.y - pu.rect.y)
-            if pu.mask.overlap(player.mask, offset):
-                active_powerups[pu.effect] = time.time() + pu.duration
+        player = self.player
+        survivors = []
+        for pu in self.powerups:
+            pu.update(dt)
+            if self.collision_grid.check(pu.rect, player.rect) and overlap(
+                    pu.shape, pu.rect.topleft, player.shape, player.rect.topleft):
+                self.active_powerups[pu.effect] = now + pu.duration
                 player.powerups_collected += 1
-                powerups.remove(pu)
+                self.telemetry.record(self.tick, KINDS["powerup_collected"], POWERUP_NAMES.index(pu.type),
+                                      0, *pu.rect.center)
+                self.powerup_pool.release(pu)
             elif pu.is_off_screen():
-                powerups.remove(pu)
-
-        # Score display
-        score_surface = score_font.render(
-            f"Score: {score}", True, (255, 255, 255))
-        screen.blit(score_surface, (10, 10))
-
-        # Health display
-        health_surface = score_font.render(
-            f"Health: {player.health}", True, (255, 255, 255))
-        screen.blit(health_surface, (10, 50))
-
-        # Timer display (top right)
-        elapsed = int(time.time() - start_time)
-        minutes = elapsed // 60
-        seconds = elapsed % 60
-
-        if minutes > last_minute_triggered and minutes > 0:
-            blink = True
-            blink_start = time.time()
-            last_minute_triggered = minutes
+                self.powerup_pool.release(pu)
+            else:
+                survivors.append(pu)
+        self.powerups = survivors
+
+    def pool_stats(self):
+        # Live / free / high-water counts per pooled class
+        return {
+            "enemies": self.enemy_pool.stats(),
+            "missiles": self.missile_pool.stats(),
+            "powerups": self.powerup_pool.stats(),
+        }
+
+    def update_difficulty(self, now):
+        self.elapsed = int(now - self.start_time)
+        minutes = self.elapsed // 60
+
+        if minutes > self.last_minute_triggered and minutes > 0:
+            self.blink = True
+            self.blink_start = now
+            self.last_minute_triggered = minutes
+            self.telemetry.record(self.tick, KINDS["difficulty_step"], 0, minutes)
 
             # Increase difficulty every minute
-            enemy_health_multiplier += 0.1  # Increase enemy health
-            enemy_speed_multiplier += 0.05  # Increase enemy speed
-            fire_delay_multiplier = max(
-                0.1, fire_delay_multiplier - 0.02)  # Decrease fire cooldown
+            step = self.difficulty_step
+            self.enemy_health_multiplier += step["health"]  # Increase enemy health
+            self.enemy_speed_multiplier += step["speed"]  # Increase enemy speed
+            self.enemy_projectile_speed_multiplier += step["projectile_speed"]
+            self.fire_delay_multiplier = max(
+                0.1, self.fire_delay_multiplier - step["fire_delay"])  # Decrease fire cooldown
             # Decrease spawn delay (increase spawn rate)
-            if enemy_spawn_delay > 0.3:
-                enemy_spawn_delay = max(0.3, enemy_spawn_delay - 0.1)
+            if self.enemy_spawn_delay > 0.3:
+                self.enemy_spawn_delay = max(
+                    0.3, self.enemy_spawn_delay - step["spawn_delay"])
 
             # Show blinking difficulty message
-            show_difficulty_msg = True
-            difficulty_msg_timer = time.time()
+            self.show_difficulty_msg = True
+            self.difficulty_msg_timer = now
+
+            if self.verbose:
+                print("Difficulty increased! New multipliers:")
+                print(f"Enemy Health: {self.enemy_health_multiplier: .2f}, Enemy Speed: {self.enemy_speed_multiplier: .2f}, Fire Delay: {self.fire_delay_multiplier: .2f}, Spawn Delay: {self.enemy_spawn_delay: .2f}, Enemy Projectile Speed: {self.enemy_projectile_speed_multiplier: .2f}")
+
+        if self.blink and now - self.blink_start > self.blink_duration:
+            self.blink = False
+
+        if self.show_difficulty_msg and now - self.difficulty_msg_timer >= self.difficulty_msg_duration:
+            self.show_difficulty_msg = False
+
+    def draw(self, screen, alpha=1.0):
+        # alpha: fraction of a step since the last update (interpolation)
+        now = game_clock.now()
+        scope = self.profiler.scope
+        with scope("player"):
+            self.player.draw(screen, now, alpha)
+        with scope("bullets"):
+            self.bullets.draw(screen, alpha)
+        with scope("missiles"):
+            for missile in self.missiles:
+                missile.draw(screen, alpha)
+        with scope("enemies"):
+            for enemy in self.enemies:
+                enemy.draw(screen, alpha)
+            self.projectiles.draw(screen, alpha)
+        with scope("power-ups"):
+            for pu in self.powerups:
+                pu.draw(screen, alpha)
+        with scope("HUD"):
+            self.draw_hud(screen, now)
+
+    def entity_counts(self):
+        return {"enemies": len(self.enemies), "bullets": self.bullets.count,
+                "missiles": len(self.missiles), "projectiles": self.projectiles.count,
+                "powerups": len(self.powerups)}
+
+    def draw_hud(self, screen, now):
+        if self.hud is None:
+            self.hud = HUD(score_font)
+        hud = self.hud
+
+        # Score and health (numbers come from the cached digit glyphs)
+        hud.draw_value(screen, "score", "Score: ", str(self.score), (10, 10))
+        hud.draw_value(screen, "health", "Health: ", str(self.player.health), (10, 50))
 
-            print("Difficulty increased! New multipliers:")
-            print(f"Enemy Health: {enemy_health_multiplier: .2f}, Enemy Speed: {enemy_speed_multiplier: .2f}, Fire Delay: {fire_delay_multiplier: .2f}, Spawn Delay: {enemy_spawn_delay: .2f}, Enemy Projectile Speed: {enemy_projectile_speed_multiplier: .2f}")
-
-        if blink and time.time() - blink_start > blink_duration:
-            blink = False
-
-        if not blink:
-            time_text = f"{minutes:02}:{seconds:02}"
-            timer_surface = score_font.render(time_text, True, (255, 255, 255))
-            screen.blit(timer_surface, (WINDOW_WIDTH -
-                        timer_surface.get_width() - 10, 10))
+        # Timer display (top right)
+        if not self.blink:
+            hud.draw_timer(screen, self.elapsed, WINDOW_WIDTH - 10, 10)
 
         # Current power-ups display
-        blinking = int(time.time() * 2) % 2 == 0
+        blinking = int(now * 2) % 2 == 0
         current_effects = []
         has_active = False
-        for key, end_time in active_powerups.items():
-            remaining = end_time - time.time()
+        for key, end_time in self.active_powerups.items():
+            remaining = end_time - now
             if remaining > 0:
                 has_active = True
                 label = key.upper()
@@ -354,23 +468,131 @@ def main():
                 powerup_text = "Power-Ups: "  # still show label line when blinking
         else:
             powerup_text = "Power-Ups: None"
-        powerup_surface = score_font.render(
-            powerup_text, True, (255, 255, 255))
-        screen.blit(powerup_surface, (10, WINDOW_HEIGHT - 40))
+        hud.draw_text(screen, "powerups", powerup_text, (10, WINDOW_HEIGHT - 40))
+
+        # Blinking "Difficulty Increased!" Message
+        if self.show_difficulty_msg and int(now * 2) % 2 == 0:  # Blink
+            hud.draw_centered(screen, "Difficulty Increased!",
+                              (WINDOW_WIDTH // 2, 30), (255, 100, 100))
+
+# === Main Game Setup ===
+
+
+def session_path(path, number):
+    # File for the number-th session of one run: the first uses path as given,
+    # restarts add a suffix (session.rec, session_2.rec, ...) so none is overwritten
+    if number == 1:
+        return path
+    root, ext = os.path.splitext(path)
+    return f"{root}_{number}{ext}"
+
+
+def main(record_path=None, dirty_rects=False, profile_path=None, render_fps=RENDER_FPS,
+         telemetry_path=None, session_number=1):
+    pygame.init()
+    screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+    pygame.display.set_caption("Platypus Out of Clay")
+    clock = pygame.time.Clock()
+
+    # Bake enemy sprite frames and masks once (shared by every spawn),
+    # straight from the prebuilt atlas when there is one (build_atlas.py)
+    asset_cache.load_atlas()
+    preload_enemy_assets()
+
+    # Background animator (loads the first background now, the rest lazily)
+    sprite_sheet_files = [
+        f"GIF_2FPS/space{i}_4-frames.png" for i in range(1, 10)]
+    background = BackgroundAnimator(sprite_sheet_files)
 
-        if game_over:
+    # The game runs on a frame clock advanced in fixed steps (banked from
+    # each frame's measured time, scaled or paused) and a seeded RNG, so a
+    # recorded input log replays bit-for-bit whatever the render rate
+    sim_clock = game_clock.FrameClock(time.time())
+    game_clock.set_source(sim_clock)
+    seed = random.randrange(2 ** 31)
+    # Per-subsystem frame timings; F3 toggles the overlay
+    profiler = Profiler()
+    overlay_text = TextCache(pygame.font.SysFont("Courier New", 16))
+    # Optional per-tick event stream (telemetry.py decodes it), one file per session
+    telemetry = None
+    if telemetry_path:
+        events_path = session_path(telemetry_path, session_number)
+        telemetry = TelemetryWriter(events_path, {"seed": seed, "start_time": sim_clock(),
+                                                  "session_number": session_number})
+    session = GameSession(seed=seed, profiler=profiler, telemetry=telemetry)
+    if telemetry:
+        print(f"Telemetry {session.session_id} -> {events_path}")
+    recorder = None
+    if record_path:
+        path = session_path(record_path, session_number)
+        recorder = InputRecorder(path, seed, sim_clock())
+        print(f"Recording {session.session_id} -> {path}")
+    # Optional dirty-rect rendering (only changed regions hit the display)
+    renderer = DirtyRectRenderer(screen) if dirty_rects else None
+    timestep = FixedTimestep()
+    clock.tick()  # asset loading does not count as the first frame
+
+    # Game loop
+    running = True
+    while running:
+        dt_ms = min(clock.tick(render_fps), MAX_FRAME_MS)
+
+        with profiler.scope("input"):
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT or (event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE):
+                    running = False  # logged once, after the loop
+                elif event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                    profiler.toggle_overlay()
+                elif event.type == pygame.KEYDOWN and event.key == pygame.K_p:
+                    sim_clock.paused = not sim_clock.paused
+                elif event.type == pygame.KEYDOWN and event.key in (pygame.K_MINUS, pygame.K_EQUALS):
+                    step = -1 if event.key == pygame.K_MINUS else 1
+                    index = TIME_SCALES.index(sim_clock.scale) + step
+                    sim_clock.scale = TIME_SCALES[max(0, min(index, len(TIME_SCALES) - 1))]
+            # Player movement using WASD
+            keys = pygame.key.get_pressed()
+            bits = encode_keys(keys[pygame.K_w], keys[pygame.K_a],
+                               keys[pygame.K_s], keys[pygame.K_d], keys[pygame.K_SPACE])
+        # Run as many fixed steps as this frame banked (in game time, so
+        # nothing when paused), with this frame's input
+        frame_ms = sim_clock.frame_ms(dt_ms)
+        timestep.add(frame_ms / 1000)
+        for dt in timestep.steps():
+            sim_clock.advance(dt)
+            session.update(*decode_keys(bits), dt)
+            if session.game_over:
+                break
+        if recorder:
+            recorder.record(bits, frame_ms)
+
+        # Draw everything
+        with profiler.scope("background"):
+            background.update(sim_clock())
+            if renderer:
+                renderer.begin_frame(background)
+            else:
+                background.draw(screen)
+        session.draw(renderer or screen, timestep.alpha)
+        with profiler.scope("HUD"):
+            profiler.draw_overlay(renderer or screen, overlay_text)
+            if sim_clock.paused or sim_clock.scale != 1.0:
+                session.hud.draw_centered(renderer or screen,
+                                          "PAUSED" if sim_clock.paused else f"x{sim_clock.scale:g}",
+                                          (WINDOW_WIDTH // 2, 70))
+
+        if session.game_over:
+            if recorder:
+                recorder.close()
+            session.telemetry.close()
             overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
             overlay.set_alpha(180)
             overlay.fill((0, 0, 0))
             screen.blit(overlay, (0, 0))
 
-            msg1 = score_font.render("GAME OVER", True, (255, 0, 0))
-            msg2 = score_font.render(
-                "E to Reset, Q to Quit", True, (255, 255, 255))
-            screen.blit(msg1, msg1.get_rect(
-                center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 - 30)))
-            screen.blit(msg2, msg2.get_rect(
-                center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 + 30)))
+            session.hud.draw_centered(screen, "GAME OVER",
+                                      (WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 - 30), (255, 0, 0))
+            session.hud.draw_centered(screen, "E to Reset, Q to Quit",
+                                      (WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 + 30))
             pygame.display.flip()
 
             # Wait for input to continue or reset
@@ -381,29 +603,35 @@ def main():
                         return
                     elif event.type == pygame.KEYDOWN:
                         if event.key == pygame.K_e:
-                            log_session(player, score, start_time)
-                            main()  # Restart the entire game
+                            session.log()
+                            if profile_path:
+                                profiler.dump(profile_path)
+                            # Restart the entire game (records to the next session's files)
+                            main(record_path, dirty_rects, profile_path, render_fps, telemetry_path,
+                                 session_number + 1)
                             return
                         elif event.key == pygame.K_q:
-                            log_session(player, score, start_time)
+                            session.log()
+                            if profile_path:
+                                profiler.dump(profile_path)
                             pygame.quit()
                             return
                 clock.tick(60)
 
-        # Blinking "Difficulty Increased!" Message
-        if show_difficulty_msg:
-            if time.time() - difficulty_msg_timer < difficulty_msg_duration:
-                if int(time.time() * 2) % 2 == 0:  # Blink
-                    msg_surface = score_font.render(
-                        "Difficulty Increased!", True, (255, 100, 100))
-                    msg_rect = msg_surface.get_rect(
-                        center=(WINDOW_WIDTH // 2, 30))
-                    screen.blit(msg_surface, msg_rect)
+        with profiler.scope("flip"):
+            if renderer:
+                renderer.end_frame()
             else:
-                show_difficulty_msg = False
-
-        pygame.display.flip()
-        clock.tick(60)
-
-    log_session(player, score, start_time)
+                pygame.display.flip()
+        profiler.end_frame(session.entity_counts())
+
+    # Log while the session's clock is still the source: survival time is
+    # game time, which wall time no longer matches after pausing or scaling
+    session.log()
+    if recorder:
+        recorder.close()
+    session.telemetry.close()
+    if profile_path:
+        profiler.dump(profile_path)
+    game_clock.reset()
     pygame.quit()
@@ -0,0 +1,151 @@
+# === headless.py ===
+import os
+
+# No window or audio device: the dummy SDL drivers still allow surface
+# conversion and masks, which the game rules rely on
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+# Keep SIGINT/SIGTERM as plain signals so pools can stop headless workers
+os.environ.setdefault("SDL_NO_SIGNAL_HANDLERS", "1")
+
+import argparse
+import random
+import time
+import numpy as np
+import pygame
+import game_clock
+import asset_cache
+import stats_logger as statistics
+from enemy import preload_enemy_assets
+from game_manager import GameSession
+from telemetry import TelemetryWriter
+from timestep import LOGIC_HZ
+
+# Constants
+TICK_RATE = LOGIC_HZ  # simulated ticks per second (same fixed step as the interactive loop)
+MAX_SESSION_SEC = 600  # simulated seconds before a session is cut off
+
+# === Input Providers ===
+
+
+class ScriptedInput:
+    # Replays a fixed list of (dx, dy, firing) ticks, looping at the end
+    def __init__(self, ticks):
+        self.ticks = list(ticks)
+        self.index = 0
+
+    def __call__(self, session):
+        tick = self.ticks[self.index % len(self.ticks)]
+        self.index += 1
+        return tick
+
+
+class AutoPilot:
+    # Simple AI: hold fire, line up with the nearest enemy, dodge projectiles
+    def __init__(self, dodge_distance=200, tick_rate=TICK_RATE):
+        self.dodge_distance = dodge_distance
+        self.tick_rate = tick_rate  # of the run it steers (sets the dead zone)
+
+    def __call__(self, session):
+        player = session.player
+        px, py = player.rect.center
+
+        # Dodge the closest incoming projectile first
+        pool = session.projectiles
+        n = pool.count
+        if n:
+            dx = np.abs(pool.x[:n] - px)
+            near = (dx < self.dodge_distance) & (np.abs(pool.y[:n] - py) < player.rect.height)
+            if near.any():
+                threat = np.flatnonzero(near)[np.argmin(dx[near])]
+                return 0, 1 if pool.y[threat] < py else -1, True
+
+        # Otherwise line up with the nearest live enemy
+        targets = [e for e in session.enemies if not e.destroyed]
+        if not targets:
+            return 0, 0, True
+        target = min(targets, key=lambda e: e.rect.centerx)
+        dy = target.rect.centery - py
+        if abs(dy) <= player.speed / self.tick_rate:
+            return 0, 0, True
+        return 0, 1 if dy > 0 else -1, True
+
+# === Headless Runner ===
+
+
+def init_headless():
+    # Surfaces need a display format even when nothing is drawn
+    pygame.init()
+    if pygame.display.get_surface() is None:
+        pygame.display.set_mode((1, 1))
+    asset_cache.load_atlas()
+    preload_enemy_assets()
+
+
+def run_session(controller=None, max_time=MAX_SESSION_SEC, tick_rate=TICK_RATE, log=True,
+                start_time=None, telemetry_path=None, **session_kwargs):
+    # Run one session on a simulated clock as fast as the CPU allows.
+    # A fixed start_time makes seeded runs reproducible; session_kwargs go
+    # to GameSession (seed, session_id, spawn_weights, enemy_overrides, difficulty)
+    controller = controller or AutoPilot(tick_rate=tick_rate)
+    clock = game_clock.FrameClock(
+        time.time() if start_time is None else start_time)
+    game_clock.set_source(clock)
+    telemetry = TelemetryWriter(telemetry_path, {"seed": session_kwargs.get("seed"),
+                                                 "start_time": clock()}) \
+        if telemetry_path else None
+    try:
+        session = GameSession(verbose=False, telemetry=telemetry, **session_kwargs)
+        dt = 1 / tick_rate
+        while not session.game_over and clock() - session.start_time < max_time:
+            dx, dy, firing = controller(session)
+            session.update(dx, dy, firing, dt)
+            clock.advance(dt)
+        if log:
+            session.log()
+        return session.stats()
+    finally:
+        if telemetry:
+            telemetry.close()
+        game_clock.reset()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Run game sessions headless on a simulated clock.")
+    parser.add_argument("--sessions", type=int, default=1)
+    parser.add_argument("--max-time", type=float, default=MAX_SESSION_SEC,
+                        help="simulated seconds per session")
+    parser.add_argument("--tick-rate", type=int, default=TICK_RATE)
+    parser.add_argument("--no-log", action="store_true",
+                        help="do not append results to gamedata.csv")
+    parser.add_argument("--telemetry", metavar="PATH",
+                        help="record gameplay events here (PATH_<n> per session with --sessions)")
+    parser.add_argument("--stats", metavar="PATH", default=statistics.CSV_FILE,
+                        help="stats file to append to (.db/.sqlite: SQLite)")
+    args = parser.parse_args(argv)
+    statistics.use_file(args.stats)
+
+    init_headless()
+    started = time.perf_counter()
+    run_id = int(time.time())
+    for i in range(args.sessions):
+        # Many sessions finish within a second, so the ID carries the seed too
+        seed = random.randrange(2 ** 31)
+        telemetry_path = args.telemetry
+        if telemetry_path and args.sessions > 1:
+            root, ext = os.path.splitext(telemetry_path)
+            telemetry_path = f"{root}_{i}{ext}"
+        stats = run_session(max_time=args.max_time, tick_rate=args.tick_rate,
+                            log=not args.no_log, telemetry_path=telemetry_path,
+                            seed=seed, session_id=f"headless_{run_id}_s{seed}")
+        print(f"{stats['session_id']}: score {stats['score']}, survived {stats['survival_time']}s, "
+              f"{stats['enemies_defeated']} kills")
+    elapsed = time.perf_counter() - started
+    print(f"{args.sessions} sessions in {elapsed:.1f}s "
+          f"({args.sessions * 60 / elapsed:.1f} sessions/min)")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+# === hud.py ===
+from collections import OrderedDict
+
+# Constants
+WHITE = (255, 255, 255)
+TEXT_CACHE_SIZE = 64  # rendered strings kept before the least recent is dropped
+DIGIT_CHARS = "0123456789:-"
+
+# === Text Cache ===
+
+
+class TextCache:
+    # Rendered surfaces keyed by (text, color), least recently used evicted first
+    def __init__(self, font, capacity=TEXT_CACHE_SIZE):
+        self.font = font
+        self.capacity = capacity
+        self._surfaces = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, text, color=WHITE):
+        key = (text, color)
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self._surfaces.move_to_end(key)
+            self.hits += 1
+            return surface
+        self.misses += 1
+        surface = self.font.render(text, True, color)
+        self._surfaces[key] = surface
+        if len(self._surfaces) > self.capacity:
+            self._surfaces.popitem(last=False)
+        return surface
+
+    def clear(self):
+        self._surfaces.clear()
+
+# === Digit Atlas ===
+
+
+class DigitAtlas:
+    # Pre-rendered glyphs so changing numbers are a few cached blits
+    def __init__(self, font, color=WHITE, chars=DIGIT_CHARS):
+        self.glyphs = {c: font.render(c, True, color) for c in chars}
+        self.height = max(g.get_height() for g in self.glyphs.values())
+
+    def width(self, text):
+        return sum(self.glyphs[c].get_width() for c in text)
+
+    def draw(self, surface, text, pos):
+        x, y = pos
+        seq = []
+        for c in text:
+            glyph = self.glyphs[c]
+            seq.append((glyph, (x, y)))
+            x += glyph.get_width()
+        surface.blits(seq, doreturn=False)
+
+# === HUD ===
+
+
+class HUD:
+    def __init__(self, font, use_atlas=True):
+        self.text = TextCache(font)
+        self.digits = DigitAtlas(font) if use_atlas else None
+        self._fields = {}  # name -> (text, surface) last drawn
+
+    def _field(self, name, text, color=WHITE):
+        # Only look the surface up again when the field's text changed
+        cached = self._fields.get(name)
+        if cached is None or cached[0] != text:
+            cached = (text, self.text.render(text, color))
+            self._fields[name] = cached
+        return cached[1]
+
+    def draw_value(self, surface, name, label, value, pos):
+        # "Label: 123" with the number drawn from the digit atlas
+        if self.digits is None:
+            surface.blit(self._field(name, f"{label}{value}"), pos)
+            return
+        label_surface = self.text.render(label)
+        surface.blit(label_surface, pos)
+        self.digits.draw(surface, value, (pos[0] + label_surface.get_width(), pos[1]))
+
+    def draw_timer(self, surface, elapsed, right, top):
+        minutes, seconds = divmod(elapsed, 60)
+        text = f"{minutes:02}:{seconds:02}"
+        if self.digits is None:
+            timer_surface = self._field("timer", text)
+            surface.blit(timer_surface, (right - timer_surface.get_width(), top))
+            return
+        self.digits.draw(surface, text, (right - self.digits.width(text), top))
+
+    def draw_text(self, surface, name, text, pos, color=WHITE):
+        surface.blit(self._field(name, text, color), pos)
+
+    def draw_centered(self, surface, text, center, color=WHITE):
+        text_surface = self.text.render(text, color)
+        surface.blit(text_surface, text_surface.get_rect(center=center))
+
+    def stats(self):
+        return {"hits": self.text.hits, "misses": self.text.misses}
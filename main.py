@@ -1,5 +1,23 @@
 # === main.py ===
-from game_manager import main
+import argparse
+import stats_logger as statistics
+from game_manager import main, RENDER_FPS
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Platypus Out of Clay")
+    parser.add_argument("--record", metavar="PATH",
+                        help="record this session's input log for replay.py")
+    parser.add_argument("--dirty-rects", action="store_true",
+                        help="only redraw changed screen regions (faster on low-end hardware)")
+    parser.add_argument("--profile-dump", metavar="PATH",
+                        help="write per-frame subsystem timings (CSV, ms) here on exit")
+    parser.add_argument("--fps", type=int, default=RENDER_FPS,
+                        help="render rate cap; gameplay speed does not depend on it")
+    parser.add_argument("--telemetry", metavar="PATH",
+                        help="record per-tick gameplay events here (decode with telemetry.py)")
+    parser.add_argument("--stats", metavar="PATH", default=statistics.CSV_FILE,
+                        help="stats file to append to (.db/.sqlite: SQLite, see stats_db.py)")
+    args = parser.parse_args()
+    statistics.use_file(args.stats)
+    main(record_path=args.record, dirty_rects=args.dirty_rects, profile_path=args.profile_dump,
+         render_fps=args.fps, telemetry_path=args.telemetry)
@@ -1,93 +1,183 @@
 # === player.py ===
 import pygame
 import os
-import time
 import math
+import numpy as np
+import asset_cache
+import game_clock
+from timestep import interpolate
 # Constants
 WINDOW_WIDTH, WINDOW_HEIGHT = 1280, 720
-
-# === Bullet Class ===
-
-
-class Bullet:
-    def __init__(self, image_path, start_pos, speed=10):
-        self.sprite_sheet = pygame.image.load(image_path).convert_alpha()
-        self.frames = []
-        self.speed_x = speed
-        self.speed_y = 0
-        frame_width = self.sprite_sheet.get_width() // 4
-        for i in range(4):
-            frame = pygame.Surface(
-                (frame_width, self.sprite_sheet.get_height()), pygame.SRCALPHA)
-            frame.blit(self.sprite_sheet, (0, 0), (i * frame_width, 0,
-                                                   frame_width, self.sprite_sheet.get_height()))
-            frame = pygame.transform.rotate(frame, -90)
-            self.frames.append(frame)
-
-        self.current_frame = 0
+BULLET_SPEED = 600  # pixels per second
+
+# Player sprite sheets (frame counts) and in-game orientation / size
+PLAYER_SIZE = (144, 144)
+PLAYER_ROTATION = -90
+SHIP_BASE_DIR = "playership/MainShip/MainShipBases"
+# Ship base sprite per health state (health 4 and up uses state 4)
+SHIP_BASES = {4: "Fullhealth.png", 3: "Slightdamage.png", 2: "Damaged.png", 1: "Verydamaged.png"}
+ENGINE_BASE = "playership/MainShip/Engines/Engines.png"
+ENGINE_EFFECT = ("playership/MainShip/Engines/Moving.png", 4)
+AUTO_CANNON = ("playership/MainShip/Weapons/AutoCannon.png", 7)
+SHIELD = ("playership/MainShip/Shields/fontshield.png", 10)
+BULLET = ("playership/MainShipWeapon/Autocannonbullet.png", 4)
+MISSILE = ("playership/MainShipWeapon/Rocket.png", 3)
+MISSILE_SIZE = (64, 64)
+
+
+def preload_player_assets():
+    # Bake every player-side frame set and hit shape into the asset cache
+    for name in SHIP_BASES.values():
+        asset_cache.get_shape(os.path.join(SHIP_BASE_DIR, name), PLAYER_SIZE, PLAYER_ROTATION)
+    asset_cache.get_image(ENGINE_BASE, PLAYER_SIZE, PLAYER_ROTATION)
+    for path, count in (ENGINE_EFFECT, AUTO_CANNON, SHIELD):
+        asset_cache.get_frames(path, count, PLAYER_SIZE, PLAYER_ROTATION)
+    asset_cache.get_shapes(BULLET[0], BULLET[1], None, PLAYER_ROTATION)
+    asset_cache.get_shapes(MISSILE[0], MISSILE[1], MISSILE_SIZE, PLAYER_ROTATION)
+
+# === Per-State Sprites ===
+
+
+class StateSprites:
+    # Image and hit shape per named state, loaded once up front so switching
+    # state (e.g. on a hit) is a dict lookup with no loading or mask building
+    def __init__(self, size, rotation):
+        self.size = size
+        self.rotation = rotation
+        self.sprites = {}  # state -> (image, hit shape)
+
+    def register(self, state, path):
+        self.sprites[state] = (
+            asset_cache.get_image(path, self.size, self.rotation),
+            asset_cache.get_shape(path, self.size, self.rotation))
+
+    def get(self, state):
+        return self.sprites[state]
+
+# === Bullet Manager (struct of arrays) ===
+
+
+class BulletManager:
+    def __init__(self, image_path, capacity=128):
+        # All bullets share one frame set; collision uses frame 0's shape
+        self.frames = asset_cache.get_frames(image_path, 4, None, -90)
+        self.shape = asset_cache.get_shapes(image_path, 4, None, -90)[0]
+        self.width, self.height = self.frames[0].get_size()
         self.animation_speed = 0.1
-        self.last_update_time = time.time()
-        self.rect = self.frames[0].get_rect(center=start_pos)
-        self.mask = pygame.mask.from_surface(self.frames[0])
-        self.speed = speed
 
-    def update(self):
-        # Move forward
-        self.rect.x += self.speed_x
-        self.rect.y += self.speed_y
-
-        # Animate
-        now = time.time()
-        if now - self.last_update_time > self.animation_speed:
-            self.current_frame = (self.current_frame + 1) % len(self.frames)
-            self.last_update_time = now
-
-    def draw(self, surface):
-        surface.blit(self.frames[self.current_frame], self.rect)
+        # Live bullets occupy [0, count) of each array; x/y are top-left
+        self.count = 0
+        self.capacity = 0
+        self._allocate(capacity)
+
+    def _allocate(self, capacity):
+        arrays = {"x": np.float64, "y": np.float64, "vx": np.float64, "vy": np.float64,
+                  "prev_x": np.float64, "prev_y": np.float64,
+                  "frame": np.int16, "frame_timer": np.float64}
+        for name, dtype in arrays.items():
+            grown = np.zeros(capacity, dtype=dtype)
+            if self.count:
+                grown[:self.count] = getattr(self, name)[:self.count]
+            setattr(self, name, grown)
+        self.capacity = capacity
+
+    def spawn(self, center, now, vx=BULLET_SPEED, vy=0):
+        if self.count == self.capacity:
+            self._allocate(self.capacity * 2)
+        i = self.count
+        self.x[i] = center[0] - self.width // 2
+        self.y[i] = center[1] - self.height // 2
+        self.vx[i], self.vy[i] = vx, vy
+        self.prev_x[i], self.prev_y[i] = self.x[i], self.y[i]
+        self.frame[i] = 0
+        self.frame_timer[i] = now
+        self.count += 1
+
+    def update(self, dt, now):
+        # Move (pixels per second) and animate every bullet, then drop
+        # off-screen ones
+        n = self.count
+        if not n:
+            return
+        x, y = self.x[:n], self.y[:n]
+        self.prev_x[:n] = x
+        self.prev_y[:n] = y
+        x += self.vx[:n] * dt
+        y += self.vy[:n] * dt
+
+        advance = now - self.frame_timer[:n] > self.animation_speed
+        if advance.any():
+            self.frame[:n][advance] = (self.frame[:n][advance] + 1) % len(self.frames)
+            self.frame_timer[:n][advance] = now
+
+        gone = (x > WINDOW_WIDTH) | (y < 0) | (y + self.height > WINDOW_HEIGHT)
+        if gone.any():
+            self.compact(~gone)
+
+    def compact(self, keep):
+        # Keep bullets where keep is True, preserving order (no list.remove)
+        n = self.count
+        kept = int(keep.sum())
+        for name in ("x", "y", "vx", "vy", "prev_x", "prev_y", "frame", "frame_timer"):
+            array = getattr(self, name)
+            array[:kept] = array[:n][keep]
+        self.count = kept
+
+    def remove(self, indices):
+        keep = np.ones(self.count, dtype=bool)
+        keep[indices] = False
+        self.compact(keep)
+
+    def rect(self, i):
+        return pygame.Rect(int(self.x[i]), int(self.y[i]), self.width, self.height)
+
+    def live(self):
+        # (index, rect) for every live bullet, for collision
+        for i in range(self.count):
+            yield i, self.rect(i)
+
+    def draw(self, surface, alpha=1.0):
+        n = self.count
+        if not n:
+            return
+        xs = (self.prev_x[:n] + (self.x[:n] - self.prev_x[:n]) * alpha).astype(np.int32)
+        ys = (self.prev_y[:n] + (self.y[:n] - self.prev_y[:n]) * alpha).astype(np.int32)
+        frames = self.frames
+        surface.blits([(frames[f], (int(bx), int(by)))
+                       for f, bx, by in zip(self.frame[:n], xs, ys)], doreturn=False)
 
 # === Missile Class (FSM) ===
 
 
-# === Missile Class ===
 class Missile:
     def __init__(self, image_path, start_pos, player, enemies):
-        self.sprite_sheet = pygame.image.load(image_path).convert_alpha()
-        self.frames = []
-        self.speed = 5
+        self.reset(image_path, start_pos, player, enemies)
+
+    def reset(self, image_path, start_pos, player, enemies):
+        self.speed = 300  # pixels per second
         self.state = "tracking"
         self.target = self.find_nearest_enemy(enemies, player.rect.center)
-        self.start_time = time.time()
+        self.start_time = game_clock.now()
         self.lifetime = 3  # seconds
 
-        # Resize the sprite sheet
-        frame_width = self.sprite_sheet.get_width() // 3
-        target_width = 64
-        target_height = 64
-
-        # load the frames
-        for i in range(3):
-            frame = pygame.Surface(
-                (frame_width, self.sprite_sheet.get_height()), pygame.SRCALPHA)
-            frame.blit(self.sprite_sheet, (0, 0), (i * frame_width,
-                       0, frame_width, self.sprite_sheet.get_height()))
-            frame = pygame.transform.scale(
-                frame, (target_width, target_height))
-            frame = pygame.transform.rotate(frame, -90)
-            self.frames.append(frame)
+        # Shared 64x64 frames from the asset cache
+        self.frames = asset_cache.get_frames(image_path, 3, (64, 64), -90)
 
         self.current_frame = 0
-        self.last_frame_time = time.time()
+        self.last_frame_time = game_clock.now()
         self.rect = self.frames[0].get_rect(center=start_pos)
-        self.mask = pygame.mask.from_surface(self.frames[0])
-        self.vx, self.vy = 7, 0  # default movement
+        self.x = self.prev_x = float(self.rect.x)
+        self.y = self.prev_y = float(self.rect.y)
+        self.shape = asset_cache.get_shapes(image_path, 3, (64, 64), -90)[0]
+        self.vx, self.vy = 420, 0  # default movement (pixels per second)
 
     def find_nearest_enemy(self, enemies, origin):
         if not enemies:
             return None
         return min(enemies, key=lambda e: (e.rect.centerx - origin[0]) ** 2 + (e.rect.centery - origin[1]) ** 2)
 
-    def update(self):
-        now = time.time()
+    def update(self, dt, now):
+        self.prev_x, self.prev_y = self.x, self.y
 
         if self.state == "tracking" and self.target:
             dx = self.target.rect.centerx - self.rect.centerx
@@ -99,30 +189,33 @@ class Missile:
             if now - self.start_time > self.lifetime:
                 self.state = "moving"
 
-        self.rect.x += self.vx
-        self.rect.y += self.vy
+        self.x += self.vx * dt
+        self.y += self.vy * dt
+        self.rect.topleft = (round(self.x), round(self.y))
 
         if now - self.last_frame_time > 0.1:
             self.current_frame = (self.current_frame + 1) % len(self.frames)
             self.last_frame_time = now
 
-    def draw(self, surface):
-        surface.blit(self.frames[self.current_frame], self.rect)
+    def draw(self, surface, alpha=1.0):
+        surface.blit(self.frames[self.current_frame],
+                     (round(interpolate(self.prev_x, self.x, alpha)),
+                      round(interpolate(self.prev_y, self.y, alpha))))
 
 
 # === PlayerShip Class ===
 class PlayerShip:
     def __init__(self, position):
-        self.base_path = "playership/MainShip/MainShipBases"
-        self.engine_base_path = "playership/MainShip/Engines/Engines.png"
-        self.engine_effect_path = "playership/MainShip/Engines/Moving.png"
-        self.auto_cannon_path = "playership/MainShip/Weapons/AutoCannon.png"
-        self.auto_cannon_bullet_path = "playership/MainShipWeapon/Autocannonbullet.png"
-        self.shield = "playership/MainShip/Shields/fontshield.png"
-
-        self.size = 144, 144
+        self.base_path = SHIP_BASE_DIR
+        self.engine_base_path = ENGINE_BASE
+        self.engine_effect_path = ENGINE_EFFECT[0]
+        self.auto_cannon_path = AUTO_CANNON[0]
+        self.auto_cannon_bullet_path = BULLET[0]
+        self.shield = SHIELD[0]
+
+        self.size = PLAYER_SIZE
         self.health = 4
-        self.speed = 5
+        self.speed = 300  # pixels per second
         self.firepower = 10
 
         self.position = position
@@ -137,29 +230,20 @@ class PlayerShip:
         self.powerups_collected = 0
         self.enemies_killed = 0
 
+        # Ship base image and mask for every health state
+        self.base_sprites = StateSprites(self.size, PLAYER_ROTATION)
+        for state, name in SHIP_BASES.items():
+            self.base_sprites.register(state, os.path.join(self.base_path, name))
+
         # Load base engine (always visible)
-        self.engine_base_image = pygame.image.load(
-            self.engine_base_path).convert_alpha()
-        self.engine_base_image = pygame.transform.scale(
-            self.engine_base_image, self.size)
-        self.engine_base_image = pygame.transform.rotate(
-            self.engine_base_image, -90)
+        self.engine_base_image = asset_cache.get_image(
+            self.engine_base_path, self.size, PLAYER_ROTATION)
         self.engine_base_rect = self.engine_base_image.get_rect(
             center=self.position)
 
         # Load engine effect frames (shown when moving)
-        self.engine_effect_frames = []
-        effect_sheet = pygame.image.load(
-            self.engine_effect_path).convert_alpha()
-        frame_width = effect_sheet.get_width() // 4
-        for i in range(4):
-            frame = pygame.Surface(
-                (frame_width, effect_sheet.get_height()), pygame.SRCALPHA)
-            frame.blit(effect_sheet, (0, 0), (i * frame_width, 0,
-                       frame_width, effect_sheet.get_height()))
-            frame = pygame.transform.scale(frame, self.size)
-            frame = pygame.transform.rotate(frame, -90)
-            self.engine_effect_frames.append(frame)
+        self.engine_effect_frames = asset_cache.get_frames(
+            self.engine_effect_path, ENGINE_EFFECT[1], self.size, PLAYER_ROTATION)
 
         self.current_effect_frame = 0
         self.engine_animation_speed = 0.1
@@ -169,17 +253,8 @@ class PlayerShip:
             center=self.position)
 
         # Load autocannon animation frames (7 total)
-        self.auto_cannon_frames = []
-        cannon_sheet = pygame.image.load(self.auto_cannon_path).convert_alpha()
-        cannon_frame_width = cannon_sheet.get_width() // 7
-        for i in range(7):
-            frame = pygame.Surface(
-                (cannon_frame_width, cannon_sheet.get_height()), pygame.SRCALPHA)
-            frame.blit(cannon_sheet, (0, 0), (i * cannon_frame_width,
-                       0, cannon_frame_width, cannon_sheet.get_height()))
-            frame = pygame.transform.scale(frame, self.size)
-            frame = pygame.transform.rotate(frame, -90)
-            self.auto_cannon_frames.append(frame)
+        self.auto_cannon_frames = asset_cache.get_frames(
+            self.auto_cannon_path, AUTO_CANNON[1], self.size, PLAYER_ROTATION)
 
         self.current_cannon_frame = 0
         self.cannon_animation_speed = 0.1
@@ -189,7 +264,6 @@ class PlayerShip:
             center=self.position)
 
         # Shield attributes
-        self.shield_frames = []
         self.shield_active = False
         self.shield_start_time = 0
         self.shield_duration = 3  # seconds
@@ -198,62 +272,42 @@ class PlayerShip:
         self.last_shield_update = 0
 
         # Load shield animation frames (10 total)
-        shield_sheet = pygame.image.load(self.shield).convert_alpha()
-        shield_frame_width = shield_sheet.get_width() // 10
-        for i in range(10):
-            frame = pygame.Surface(
-                (shield_frame_width, shield_sheet.get_height()), pygame.SRCALPHA)
-            frame.blit(shield_sheet, (0, 0), (i * shield_frame_width, 0,
-                       shield_frame_width, shield_sheet.get_height()))
-            frame = pygame.transform.scale(frame, self.size)
-            frame = pygame.transform.rotate(frame, -90)
-            self.shield_frames.append(frame)
+        self.shield_frames = asset_cache.get_frames(
+            self.shield, SHIELD[1], self.size, PLAYER_ROTATION)
 
         self.update_sprite()
 
     def update_sprite(self):
-        if self.health >= 4:
-            sprite_name = "FullHealth.png"
-        elif self.health == 3:
-            sprite_name = "SlightDamage.png"
-        elif self.health == 2:
-            sprite_name = "Damaged.png"
-        else:
-            sprite_name = "VeryDamaged.png"
-
-        image_path = os.path.join(self.base_path, sprite_name)
-        original_image = pygame.image.load(image_path).convert_alpha()
-        original_image = pygame.transform.scale(original_image, self.size)
-        rotated_image = pygame.transform.rotate(original_image, -90)
-        self.image = rotated_image
+        # Preloaded sprite for the current health state
+        self.image, self.shape = self.base_sprites.get(max(1, min(self.health, 4)))
 
         if self.rect:
             center = self.rect.center
             self.rect = self.image.get_rect(center=center)
         else:
             self.rect = self.image.get_rect(center=self.position)
+            self.x = self.prev_x = float(self.rect.x)
+            self.y = self.prev_y = float(self.rect.y)
 
         self.engine_base_rect.center = self.rect.center
         self.engine_effect_rect.center = self.rect.center
         self.auto_cannon_rect.center = self.rect.center
-        self.mask = pygame.mask.from_surface(self.image)  # <- update mask here
 
-    def move(self, dx, dy):
+    def move(self, dx, dy, dt, now):
         self.is_moving = dx != 0 or dy != 0
 
-        # Save old center for distance calculation
-        old_x, old_y = self.rect.center
+        # Save old position for distance calculation and interpolation
+        self.prev_x, self.prev_y = self.x, self.y
 
         # Calculate new position with boundaries
-        new_x = max(0, min(self.rect.x + dx * self.speed,
-                    WINDOW_WIDTH - self.rect.width))
-        new_y = max(0, min(self.rect.y + dy * self.speed,
-                    WINDOW_HEIGHT - self.rect.height))
-        self.rect.x, self.rect.y = new_x, new_y
+        self.x = max(0, min(self.x + dx * self.speed * dt,
+                     WINDOW_WIDTH - self.rect.width))
+        self.y = max(0, min(self.y + dy * self.speed * dt,
+                     WINDOW_HEIGHT - self.rect.height))
+        self.rect.topleft = (round(self.x), round(self.y))
 
         # Calculate and add distance moved
-        new_center = self.rect.center
-        self.total_distance += math.hypot(new_center[0] - old_x, new_center[1] - old_y)
+        self.total_distance += math.hypot(self.x - self.prev_x, self.y - self.prev_y)
 
         # Update engine and cannon positions
         self.engine_base_rect.center = self.rect.center
@@ -262,14 +316,13 @@ class PlayerShip:
 
         # Animate effect if moving
         if self.is_moving:
-            now = time.time()
             if now - self.last_engine_update > self.engine_animation_speed:
                 self.current_effect_frame = (
                     self.current_effect_frame + 1) % len(self.engine_effect_frames)
                 self.engine_effect_image = self.engine_effect_frames[self.current_effect_frame]
                 self.last_engine_update = now
 
-    def take_damage(self):
+    def take_damage(self, now):
         if self.shield_active:
             return  # Shield blocks the damage
 
@@ -277,21 +330,29 @@ class PlayerShip:
             self.health -= 1
             self.update_sprite()
             if self.health > 0:
-                self.activate_shield()
+                self.activate_shield(now)
+
+    def update_shield(self, now):
+        # Expire shield (game rule, so it runs even when nothing is drawn)
+        if self.shield_active and now - self.shield_start_time > self.shield_duration:
+            self.shield_active = False
 
-    def activate_shield(self):
+    def activate_shield(self, now):
         self.shield_active = True
-        self.shield_start_time = time.time()
+        self.shield_start_time = now
         self.shield_frame_index = 0
         self.last_shield_update = 0
 
-    def draw(self, surface):
+    def draw(self, surface, now, alpha=1.0):
+        # Every part is drawn offset from its rect by the interpolation
+        ox = round(interpolate(self.prev_x, self.x, alpha)) - self.rect.x
+        oy = round(interpolate(self.prev_y, self.y, alpha)) - self.rect.y
+
         # Always draw base engine first
-        surface.blit(self.engine_base_image, self.engine_base_rect)
+        surface.blit(self.engine_base_image, self.engine_base_rect.move(ox, oy))
 
         # Animate autocannon if firing
         if self.firing:
-            now = time.time()
             if now - self.last_cannon_update > self.cannon_animation_speed:
                 self.current_cannon_frame = (
                     self.current_cannon_frame + 1) % len(self.auto_cannon_frames)
@@ -301,24 +362,20 @@ class PlayerShip:
             self.auto_cannon_image = self.auto_cannon_frames[0]
             self.current_cannon_frame = 0
 
-        surface.blit(self.auto_cannon_image, self.auto_cannon_rect)
+        surface.blit(self.auto_cannon_image, self.auto_cannon_rect.move(ox, oy))
 
         # Draw moving effect on top if moving
         if self.is_moving:
-            surface.blit(self.engine_effect_image, self.engine_effect_rect)
+            surface.blit(self.engine_effect_image, self.engine_effect_rect.move(ox, oy))
 
         # Draw shield animation if active
         if self.shield_active:
-            now = time.time()
-            if now - self.shield_start_time > self.shield_duration:
-                self.shield_active = False
-            else:
-                if now - self.last_shield_update > 1 / self.shield_fps:
-                    self.shield_frame_index = (
-                        self.shield_frame_index + 1) % len(self.shield_frames)
-                    self.last_shield_update = now
-                shield_image = self.shield_frames[self.shield_frame_index]
-                surface.blit(shield_image, self.rect)
+            if now - self.last_shield_update > 1 / self.shield_fps:
+                self.shield_frame_index = (
+                    self.shield_frame_index + 1) % len(self.shield_frames)
+                self.last_shield_update = now
+            shield_image = self.shield_frames[self.shield_frame_index]
+            surface.blit(shield_image, self.rect.move(ox, oy))
 
         # Draw ship above everything
-        surface.blit(self.image, self.rect)
+        surface.blit(self.image, self.rect.move(ox, oy))
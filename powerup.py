@@ -1,4 +1,7 @@
 import pygame
+from collision import HitShape
+import random
+from timestep import interpolate
 
 WINDOW_HEIGHT = 720
 
@@ -23,26 +26,55 @@ POWERUP_TYPES = {
     }
 }
 
+DROP_CHANCE = 0.3  # chance a destroyed enemy drops a power-up
+
+
+def roll_drop(rng=random):
+    # Power-up type to drop, or None
+    if rng.random() < DROP_CHANCE:
+        return rng.choice(["SG", "IF", "MS"])
+    return None
+
+
+# Label surfaces and hit shapes are shared by every power-up of a type
+_font = None
+_labels = {}
+
+
+def _label(type):
+    global _font
+    if type not in _labels:
+        if _font is None:
+            _font = pygame.font.SysFont("Arial", 36, bold=True)
+        data = POWERUP_TYPES[type]
+        text = _font.render(data["label"], True, data["color"])
+        _labels[type] = (text, HitShape(pygame.mask.from_surface(text)))
+    return _labels[type]
+
 
 class PowerUp:
     def __init__(self, x, y, type):
+        self.reset(x, y, type)
+
+    def reset(self, x, y, type):
         self.type = type
         data = POWERUP_TYPES[type]
         self.effect = data["effect"]
         self.duration = data["duration"]
 
         # Text-based rendering
-        self.font = pygame.font.SysFont("Arial", 36, bold=True)
-        self.text = self.font.render(data["label"], True, data["color"])
+        self.text, self.shape = _label(type)
         self.rect = self.text.get_rect(center=(x, y))
-        self.mask = pygame.mask.from_surface(self.text)
-        self.fall_speed = 2
+        self.y = self.prev_y = float(self.rect.y)
+        self.fall_speed = 120  # pixels per second
 
-    def update(self):
-        self.rect.y += self.fall_speed
+    def update(self, dt):
+        self.prev_y = self.y
+        self.y += self.fall_speed * dt
+        self.rect.y = round(self.y)
 
-    def draw(self, surface):
-        surface.blit(self.text, self.rect)
+    def draw(self, surface, alpha=1.0):
+        surface.blit(self.text, (self.rect.x, round(interpolate(self.prev_y, self.y, alpha))))
 
     def is_off_screen(self):
         return self.rect.top > WINDOW_HEIGHT
@@ -0,0 +1,138 @@
+# === profiler.py ===
+import time
+import numpy as np
+
+# Constants
+SCOPES = ("input", "background", "player", "bullets", "missiles", "spawning", "enemies",
+          "projectile collision", "power-ups", "HUD", "flip")
+HISTORY_FRAMES = 600  # ring buffer length (10 s at 60 FPS)
+OVERLAY_REFRESH_SEC = 0.5  # how often the overlay text is recomputed
+OVERLAY_COLOR = (180, 255, 180)
+OVERLAY_TOP = 90  # below the score and health lines
+OVERLAY_COLUMNS = (10, 180, 240, 300)
+
+# === Scopes ===
+
+
+class _Scope:
+    # Reusable context manager adding its elapsed time to one column
+    __slots__ = ("times", "index", "start")
+
+    def __init__(self, times, index):
+        self.times = times
+        self.index = index
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+
+    def __exit__(self, *exc):
+        self.times[self.index] += time.perf_counter() - self.start
+
+
+class _NullScope:
+    __slots__ = ()
+
+    def __enter__(self):
+        pass
+
+    def __exit__(self, *exc):
+        pass
+
+
+class NullProfiler:
+    # Default for sessions that are not being profiled (headless, replay)
+    _scope = _NullScope()
+
+    def scope(self, name):
+        return self._scope
+
+    def end_frame(self, counts=None):
+        pass
+
+# === Frame Profiler ===
+
+
+class Profiler:
+    def __init__(self, history=HISTORY_FRAMES, scopes=SCOPES):
+        self.scopes = scopes
+        self.history = np.zeros((history, len(scopes)))  # seconds per frame and scope
+        self.frame_times = np.zeros(history)
+        self.frames = 0  # total frames recorded (ring index = frames % history)
+        self.current = np.zeros(len(scopes))
+        self._scopes = {name: _Scope(self.current, i) for i, name in enumerate(scopes)}
+        self.counts = {}
+        self._frame_start = time.perf_counter()
+
+        self.show_overlay = False
+        self._overlay_rows = []
+        self._overlay_time = 0.0
+
+    def scope(self, name):
+        return self._scopes[name]
+
+    def end_frame(self, counts=None):
+        # Push this frame's scope totals into the ring buffer
+        now = time.perf_counter()
+        row = self.frames % len(self.history)
+        self.history[row] = self.current
+        self.frame_times[row] = now - self._frame_start
+        self._frame_start = now
+        self.current[:] = 0
+        self.frames += 1
+        if counts is not None:
+            self.counts = counts
+
+    def recorded(self):
+        # Scope and frame times (seconds) in chronological order
+        n = min(self.frames, len(self.history))
+        start = self.frames % len(self.history) if self.frames > n else 0
+        order = (np.arange(n) + start) % len(self.history)
+        return self.history[order], self.frame_times[order]
+
+    def percentiles(self, q=(50, 95, 99)):
+        # scope -> (p50, p95, p99) in milliseconds over the buffered frames
+        times, frame_times = self.recorded()
+        if not len(times):
+            return {}
+        per_scope = np.percentile(times, q, axis=0).T * 1000
+        result = {name: tuple(per_scope[i]) for i, name in enumerate(self.scopes)}
+        result["frame"] = tuple(np.percentile(frame_times, q) * 1000)
+        return result
+
+    # === Overlay ===
+
+    def toggle_overlay(self):
+        self.show_overlay = not self.show_overlay
+        self._overlay_time = 0.0
+
+    def draw_overlay(self, surface, text_cache):
+        # Text only changes every OVERLAY_REFRESH_SEC, so the cache absorbs redraws
+        if not self.show_overlay:
+            return
+        now = time.perf_counter()
+        if now - self._overlay_time > OVERLAY_REFRESH_SEC:
+            self._overlay_time = now
+            rows = [("scope", "p50", "p95", "p99")]
+            for name, values in self.percentiles().items():
+                rows.append((name,) + tuple(f"{v:.2f}" for v in values))
+            rows.append((" ".join(f"{k}={v}" for k, v in self.counts.items()),))
+            self._overlay_rows = rows
+        # Cells sit at fixed columns so proportional fonts still line up
+        y = OVERLAY_TOP
+        for row in self._overlay_rows:
+            height = 0
+            for x, cell in zip(OVERLAY_COLUMNS, row):
+                cell_surface = text_cache.render(cell, OVERLAY_COLOR)
+                surface.blit(cell_surface, (x, y))
+                height = max(height, cell_surface.get_height())
+            y += height
+
+    # === Dump ===
+
+    def dump(self, path):
+        # One CSV row per buffered frame, times in milliseconds
+        times, frame_times = self.recorded()
+        header = ",".join(["frame"] + [name.replace(" ", "_") for name in self.scopes])
+        data = np.column_stack([frame_times, times]) * 1000
+        np.savetxt(path, data, delimiter=",", header=header, comments="", fmt="%.4f")
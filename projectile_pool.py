@@ -0,0 +1,161 @@
+# === projectile_pool.py ===
+import numpy as np
+from collision import overlap
+
+# Constants
+WINDOW_WIDTH, WINDOW_HEIGHT = 1280, 720
+MOVING, TRACKING = 0, 1  # projectile states
+TRACKING_LIFETIME = 3  # seconds before a tracking projectile stops tracking
+FRAME_TIME = 0.1  # seconds per animation frame
+CULL_MARGIN = 64  # pixels beyond the playfield before a projectile is dropped
+
+# === Enemy Projectile Pool (struct of arrays) ===
+
+
+class ProjectilePool:
+    def __init__(self, capacity=256):
+        self.count = 0  # live projectiles occupy [0, count)
+        self._allocate(capacity)
+
+        # Per owner type sprites, registered once per enemy type
+        self.type_ids = {}
+        self.frames = []  # (frames, flipped frames)
+        self.shapes = []  # (hit shapes, flipped hit shapes)
+        self.frame_counts = np.zeros(0, dtype=np.int16)
+        self.half_sizes = np.zeros((0, 2), dtype=np.int32)
+
+    def _allocate(self, capacity):
+        old = self.count
+        arrays = {
+            "x": np.float64, "y": np.float64, "vx": np.float64, "vy": np.float64,
+            "prev_x": np.float64, "prev_y": np.float64,
+            "start_time": np.float64, "frame_timer": np.float64,
+            "frame": np.int16, "state": np.int8, "owner": np.int8,
+        }
+        for name, dtype in arrays.items():
+            grown = np.zeros(capacity, dtype=dtype)
+            if old:
+                grown[:old] = getattr(self, name)[:old]
+            setattr(self, name, grown)
+        self.capacity = capacity
+
+    def register(self, name, frames, shapes, flipped_frames, flipped_shapes):
+        # Owner type id for an enemy type (idempotent)
+        if name in self.type_ids:
+            return self.type_ids[name]
+        type_id = len(self.frames)
+        self.type_ids[name] = type_id
+        self.frames.append((frames, flipped_frames))
+        self.shapes.append((shapes, flipped_shapes))
+        self.frame_counts = np.append(self.frame_counts, len(frames))
+        w, h = frames[0].get_size()
+        self.half_sizes = np.vstack([self.half_sizes, [w // 2, h // 2]])
+        return type_id
+
+    def spawn(self, owner, x, y, vx, vy, now, state=MOVING):
+        if self.count == self.capacity:
+            self._allocate(self.capacity * 2)
+        i = self.count
+        self.x[i], self.y[i], self.vx[i], self.vy[i] = x, y, vx, vy
+        self.prev_x[i], self.prev_y[i] = x, y
+        self.start_time[i] = now
+        self.frame_timer[i] = now
+        self.frame[i] = 0
+        self.state[i] = state
+        self.owner[i] = owner
+        self.count += 1
+
+    def update(self, now, dt):
+        # Advance every live projectile by dt seconds (velocities are in
+        # pixels per second) in a handful of array operations
+        n = self.count
+        if not n:
+            return
+        state = self.state[:n]
+        state[(state == TRACKING) & (now - self.start_time[:n] > TRACKING_LIFETIME)] = MOVING
+
+        x, y = self.x[:n], self.y[:n]
+        vx, vy = self.vx[:n], self.vy[:n]
+        self.prev_x[:n] = x
+        self.prev_y[:n] = y
+        x += vx * dt
+        y += vy * dt
+
+        advance = now - self.frame_timer[:n] > FRAME_TIME
+        if advance.any():
+            frame = self.frame[:n]
+            frame[advance] = (frame[advance] + 1) % \
+                self.frame_counts[self.owner[:n][advance]]
+            self.frame_timer[:n][advance] = now
+
+        # Drop projectiles that left the playfield and are moving away from it
+        gone = ((x < -CULL_MARGIN) & (vx <= 0)) | ((x > WINDOW_WIDTH + CULL_MARGIN) & (vx >= 0)) \
+            | ((y < -CULL_MARGIN) & (vy <= 0)) | ((y > WINDOW_HEIGHT + CULL_MARGIN) & (vy >= 0))
+        if gone.any():
+            self.compact(~gone)
+
+    def compact(self, keep):
+        # Keep only projectiles where keep is True, preserving order
+        n = self.count
+        kept = int(keep.sum())
+        for name in ("x", "y", "vx", "vy", "prev_x", "prev_y", "start_time", "frame_timer", "frame", "state", "owner"):
+            array = getattr(self, name)
+            array[:kept] = array[:n][keep]
+        self.count = kept
+
+    def remove(self, indices):
+        keep = np.ones(self.count, dtype=bool)
+        keep[indices] = False
+        self.compact(keep)
+
+    def sprite(self, i):
+        # Image and hit shape of projectile i (pre-flipped when moving right)
+        flipped = 1 if self.vx[i] > 0 else 0
+        owner, frame = self.owner[i], self.frame[i]
+        return self.frames[owner][flipped][frame], self.shapes[owner][flipped][frame]
+
+    def candidates(self, rect):
+        # Indices whose bounding box (padded for odd sizes and rounding)
+        # intersects rect
+        n = self.count
+        if not n:
+            return np.zeros(0, dtype=np.intp)
+        half = self.half_sizes[self.owner[:n]] + 2
+        hit = (self.x[:n] + half[:, 0] > rect.left) & (self.x[:n] - half[:, 0] < rect.right) \
+            & (self.y[:n] + half[:, 1] > rect.top) & (self.y[:n] - half[:, 1] < rect.bottom)
+        return np.flatnonzero(hit)
+
+    def collide(self, rect, shape, grid=None):
+        # Pixel-perfect hits against one target (the player), in index order
+        candidates = self.candidates(rect)
+        hits = []
+        if len(candidates):
+            # Top-left corners rounded exactly as draw() places the sprites
+            half = self.half_sizes[self.owner[candidates]]
+            lefts = np.floor(self.x[candidates] + 0.5).astype(np.int32) - half[:, 0]
+            tops = np.floor(self.y[candidates] + 0.5).astype(np.int32) - half[:, 1]
+        for k, i in enumerate(candidates):
+            img, projectile_shape = self.sprite(i)
+            projectile_rect = img.get_rect(topleft=(int(lefts[k]), int(tops[k])))
+            if projectile_rect.colliderect(rect) and overlap(
+                    projectile_shape, projectile_rect.topleft, shape, rect.topleft):
+                hits.append(i)
+        if grid is not None:
+            grid.record(len(candidates), self.count - len(candidates))
+        return hits
+
+    def draw(self, surface, alpha=1.0):
+        # Centers interpolated between the last two steps
+        n = self.count
+        if not n:
+            return
+        half = self.half_sizes[self.owner[:n]]
+        xs = self.prev_x[:n] + (self.x[:n] - self.prev_x[:n]) * alpha
+        ys = self.prev_y[:n] + (self.y[:n] - self.prev_y[:n]) * alpha
+        lefts = np.floor(xs + 0.5).astype(np.int32) - half[:, 0]
+        tops = np.floor(ys + 0.5).astype(np.int32) - half[:, 1]
+        surface.blits([(self.sprite(i)[0], (int(lefts[i]), int(tops[i])))
+                       for i in range(n)], doreturn=False)
+
+    def clear(self):
+        self.count = 0
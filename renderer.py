@@ -0,0 +1,56 @@
+# === renderer.py ===
+import pygame
+
+# === Dirty-Rect Renderer ===
+# Stands in for the screen surface: every blit made by the entities' draw()
+# methods is recorded, so the next frame only restores the background under
+# those rects and only those regions are pushed to the display. The full
+# screen is redrawn only when the background frame changes (2 FPS).
+
+
+class DirtyRectRenderer:
+    def __init__(self, screen):
+        self.screen = screen
+        self.dirty = []  # rects drawn this frame
+        self.previous = []  # rects drawn last frame
+        self.background_key = None
+        self.full_redraw = True
+
+    def begin_frame(self, background):
+        key = background.frame_key()
+        if self.full_redraw or key != self.background_key:
+            background.draw(self.screen)
+            self.background_key = key
+            self.full_redraw = True
+        else:
+            # Erase last frame's sprites with the unchanged background
+            bg_surface = background.current_surface()
+            for rect in self.previous:
+                self.screen.blit(bg_surface, rect, rect)
+        self.dirty = []
+
+    def blit(self, source, dest, area=None, special_flags=0):
+        rect = self.screen.blit(source, dest, area, special_flags)
+        self.dirty.append(rect)
+        return rect
+
+    def blits(self, blit_sequence, doreturn=True):
+        rects = self.screen.blits(blit_sequence, doreturn=True)
+        self.dirty.extend(rects)
+        return rects if doreturn else None
+
+    def end_frame(self):
+        if self.full_redraw:
+            pygame.display.flip()
+            self.full_redraw = False
+        else:
+            pygame.display.update(self.previous + self.dirty)
+        self.previous = self.dirty
+
+    def invalidate(self):
+        # Force a full redraw next frame (e.g. after an overlay)
+        self.full_redraw = True
+
+    def __getattr__(self, name):
+        # Anything else (get_width, fill, ...) goes to the real screen
+        return getattr(self.screen, name)
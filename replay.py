@@ -0,0 +1,139 @@
+# === replay.py ===
+import argparse
+import struct
+import time
+
+# Input log layout: one header, then one 3-byte record per rendered frame
+# (WASD/space bitfield + the game time in ms banked into the fixed timestep,
+# i.e. after pause and time scaling)
+MAGIC = b"PLRP"
+VERSION = 2  # 2: frame times feed the fixed-timestep accumulator
+HEADER = struct.Struct("<4sHqd")  # magic, version, seed, start time
+RECORD = struct.Struct("<BH")  # input bits, dt in milliseconds
+
+KEY_W, KEY_A, KEY_S, KEY_D, KEY_SPACE = 1, 2, 4, 8, 16
+
+# === Input Encoding ===
+
+
+def encode_keys(w, a, s, d, space):
+    return (KEY_W if w else 0) | (KEY_A if a else 0) | (KEY_S if s else 0) \
+        | (KEY_D if d else 0) | (KEY_SPACE if space else 0)
+
+
+def decode_keys(bits):
+    # Same precedence as the interactive loop (D beats A, S beats W)
+    dx = dy = 0
+    if bits & KEY_A:
+        dx = -1
+    if bits & KEY_D:
+        dx = 1
+    if bits & KEY_W:
+        dy = -1
+    if bits & KEY_S:
+        dy = 1
+    return dx, dy, bool(bits & KEY_SPACE)
+
+# === Recorder / Reader ===
+
+
+class InputRecorder:
+    def __init__(self, path, seed, start_time):
+        self.file = open(path, "wb")
+        self.file.write(HEADER.pack(MAGIC, VERSION, seed, start_time))
+
+    def record(self, bits, dt_ms):
+        self.file.write(RECORD.pack(bits, dt_ms))
+
+    def close(self):
+        self.file.close()
+
+
+class InputLog:
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            data = f.read()
+        magic, version, self.seed, self.start_time = HEADER.unpack_from(data)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not a version {VERSION} input log")
+        body = data[HEADER.size:]
+        usable = len(body) - len(body) % RECORD.size  # ignore a torn last record
+        self.records = list(RECORD.iter_unpack(body[:usable]))
+
+    def __len__(self):
+        return len(self.records)
+
+# === Playback ===
+
+
+def replay(path, render=False, realtime=False):
+    # Re-execute a recorded session tick by tick; returns its session stats
+    import pygame
+    import game_clock
+    import asset_cache
+    from enemy import preload_enemy_assets
+    from game_manager import GameSession, WINDOW_WIDTH, WINDOW_HEIGHT
+    from background import BackgroundAnimator
+    from timestep import FixedTimestep
+
+    log = InputLog(path)
+    pygame.init()
+    screen = pygame.display.set_mode(
+        (WINDOW_WIDTH, WINDOW_HEIGHT) if render else (1, 1))
+    asset_cache.load_atlas()
+    preload_enemy_assets()
+    background = None
+    if render:
+        background = BackgroundAnimator(
+            [f"GIF_2FPS/space{i}_4-frames.png" for i in range(1, 10)])
+
+    clock = game_clock.FrameClock(log.start_time)
+    game_clock.set_source(clock)
+    try:
+        session = GameSession(seed=log.seed, verbose=False)
+        timestep = FixedTimestep()
+        for bits, dt_ms in log.records:
+            # Same stepping as the live loop: bank the frame time, then run
+            # every whole fixed step it covers
+            timestep.add(dt_ms / 1000)
+            for dt in timestep.steps():
+                clock.advance(dt)
+                session.update(*decode_keys(bits), dt)
+                if session.game_over:
+                    break
+            if render:
+                pygame.event.pump()
+                background.update(clock())
+                background.draw(screen)
+                session.draw(screen, timestep.alpha)
+                pygame.display.flip()
+                if realtime:
+                    time.sleep(dt_ms / 1000)
+        return session.stats()
+    finally:
+        game_clock.reset()
+        pygame.quit()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Replay a recorded input log (headless at max speed by default).")
+    parser.add_argument("path")
+    parser.add_argument("--render", action="store_true",
+                        help="draw the replay in a window")
+    parser.add_argument("--realtime", action="store_true",
+                        help="with --render, wait out each recorded frame time")
+    args = parser.parse_args(argv)
+
+    if not args.render:
+        import headless  # noqa: F401  (selects the dummy SDL drivers)
+    started = time.perf_counter()
+    stats = replay(args.path, render=args.render, realtime=args.realtime)
+    elapsed = time.perf_counter() - started
+    print(f"{stats['session_id']}: score {stats['score']}, survived {stats['survival_time']}s, "
+          f"{stats['enemies_defeated']} kills, shots {stats['shots_fired']}/{stats['shots_hit']} "
+          f"(replayed in {elapsed:.2f}s)")
+
+
+if __name__ == "__main__":
+    main()
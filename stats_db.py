@@ -0,0 +1,221 @@
+# === stats_db.py ===
+import argparse
+import csv
+import hashlib
+import itertools
+import json
+import os
+import sqlite3
+from stats_logger import CSV_FILE, FIELDNAMES
+
+# Constants
+DB_FILE = "gamedata.db"
+IMPORT_CHUNK = 10000  # CSV rows per insert transaction
+FINGERPRINT_BYTES = 4096  # bytes hashed at each end of an imported prefix
+
+# One column per stats_logger field, same names as the CSV header
+COLUMNS = {
+    "Timestamp": "TEXT NOT NULL",  # "YYYY-MM-DD HH:MM:SS" sorts chronologically
+    "SessionID": "TEXT NOT NULL",
+    "DistanceTraveled": "REAL",
+    "ShotsFired": "INTEGER",
+    "ShotsHit": "INTEGER",
+    "PowerUpsUsed": "INTEGER",
+    "SurvivalTime": "REAL",
+    "EnemiesDefeated": "INTEGER",
+    "Score": "INTEGER",
+    "PowerUpEffectiveness": "REAL",
+    "EnemiesDefeatedPerMinute": "REAL",
+    "AccuracyPerMinute": "REAL",
+}
+INDEXES = {
+    "idx_sessions_timestamp": "Timestamp",
+    "idx_sessions_score": "Score",
+    "idx_sessions_survival": "SurvivalTime",
+}
+# Metrics the leaderboard may rank by and the aggregates may average
+METRICS = [name for name in FIELDNAMES if name not in ("Timestamp", "SessionID")]
+
+_INSERT = (f"INSERT INTO sessions ({', '.join(FIELDNAMES)}) "
+           f"VALUES ({', '.join('?' * len(FIELDNAMES))})")
+
+# === Schema ===
+
+
+def connect(path=DB_FILE):
+    # Open (creating the tables and indexes if needed). Every logged row is
+    # kept (timestamps have one-second resolution, so they are no key);
+    # imports remembers how much of each CSV is already in the table
+    conn = sqlite3.connect(path)
+    conn.execute("PRAGMA journal_mode=WAL")
+    columns = ", ".join(f"{name} {kind}" for name, kind in COLUMNS.items())
+    conn.execute(f"CREATE TABLE IF NOT EXISTS sessions ({columns})")
+    conn.execute("CREATE TABLE IF NOT EXISTS imports (Path TEXT PRIMARY KEY, "
+                 "BytesImported INTEGER NOT NULL, Fingerprint TEXT NOT NULL)")
+    for index, column in INDEXES.items():
+        conn.execute(f"CREATE INDEX IF NOT EXISTS {index} ON sessions ({column})")
+    conn.commit()
+    return conn
+
+# === Writing ===
+
+
+def insert_rows(conn, rows):
+    # Rows are stats_logger.make_row() dicts (or CSV DictReader rows);
+    # returns how many were stored
+    with conn:
+        before = conn.total_changes
+        conn.executemany(_INSERT, ([row[name] for name in FIELDNAMES] for row in rows))
+        return conn.total_changes - before
+
+
+def append_rows(path, rows):
+    # Used by stats_logger's writer thread (one connection per batch)
+    conn = connect(path)
+    try:
+        insert_rows(conn, rows)
+    finally:
+        conn.close()
+
+
+def fingerprint(f, length):
+    # Hash of both ends of the first `length` bytes, so a rewritten (rather
+    # than appended) file is noticed without reading all of it
+    f.seek(0)
+    head = f.read(min(FINGERPRINT_BYTES, length))
+    f.seek(max(0, length - FINGERPRINT_BYTES))
+    tail = f.read(min(FINGERPRINT_BYTES, length))
+    return hashlib.sha1(head + tail).hexdigest()
+
+
+def import_csv(csv_path=CSV_FILE, db_path=DB_FILE, chunk=IMPORT_CHUNK):
+    # Stream the rows of a stats CSV not imported yet into the database,
+    # IMPORT_CHUNK rows per transaction. Each transaction also records the
+    # byte offset it reached, so importing the same (or a grown) file again
+    # only adds new rows; a file rewritten since is imported from the start.
+    # Returns (rows added, bytes of the file skipped as already imported)
+    conn = connect(db_path)
+    key = os.path.abspath(csv_path)
+    added = skipped = 0
+    try:
+        with open(csv_path, "rb") as f:
+            header = next(csv.reader([f.readline().decode()]), None)
+            offset = f.tell()
+            done = conn.execute("SELECT BytesImported, Fingerprint FROM imports WHERE Path = ?",
+                                (key,)).fetchone()
+            if done and done[0] <= os.fstat(f.fileno()).st_size \
+                    and fingerprint(f, done[0]) == done[1]:
+                offset = skipped = done[0]
+            f.seek(offset)
+            while header:
+                lines = list(itertools.islice(f, chunk))
+                # A half-written last line waits for the next import
+                complete = lines if not lines or lines[-1].endswith(b"\n") else lines[:-1]
+                if not complete:
+                    break
+                offset += sum(len(line) for line in complete)
+                rows = [row for row in csv.DictReader((line.decode() for line in complete),
+                                                      fieldnames=header)
+                        if row["Timestamp"] != "Timestamp"]  # repeated header of a merged file
+                with conn:
+                    conn.executemany(_INSERT, ([row[name] for name in FIELDNAMES] for row in rows))
+                    conn.execute("INSERT OR REPLACE INTO imports VALUES (?, ?, ?)",
+                                 (key, offset, fingerprint(f, offset)))
+                f.seek(offset)
+                added += len(rows)
+                if len(complete) < chunk:
+                    break
+    finally:
+        conn.close()
+    return added, skipped
+
+# === Queries ===
+
+
+def _window(since=None, until=None, min_survival=None):
+    # WHERE clause for an optional [since, until) window and survival floor
+    clauses, params = [], []
+    if since:
+        clauses.append("Timestamp >= ?")
+        params.append(since)
+    if until:
+        clauses.append("Timestamp < ?")
+        params.append(until)
+    if min_survival is not None:
+        clauses.append("SurvivalTime >= ?")
+        params.append(min_survival)
+    return (" WHERE " + " AND ".join(clauses) if clauses else ""), params
+
+
+def top_sessions(conn, k=10, metric="Score", since=None, until=None, min_survival=None):
+    # Top-K leaderboard by an indexed (or any) metric, best first
+    if metric not in METRICS:
+        raise ValueError(f"unknown metric {metric!r}")
+    where, params = _window(since, until, min_survival)
+    cursor = conn.execute(
+        f"SELECT Timestamp, SessionID, {metric} FROM sessions{where} "
+        f"ORDER BY {metric} DESC LIMIT ?", params + [k])
+    return [{"Timestamp": ts, "SessionID": sid, metric: value} for ts, sid, value in cursor]
+
+
+def aggregate(conn, metrics=METRICS, since=None, until=None, min_survival=None):
+    # Session count plus mean/min/max of each metric over the window
+    for metric in metrics:
+        if metric not in METRICS:
+            raise ValueError(f"unknown metric {metric!r}")
+    where, params = _window(since, until, min_survival)
+    columns = ", ".join(f"AVG({m}), MIN({m}), MAX({m})" for m in metrics)
+    row = conn.execute(f"SELECT COUNT(*), {columns} FROM sessions{where}", params).fetchone()
+    result = {"sessions": row[0]}
+    for i, metric in enumerate(metrics):
+        mean, low, high = row[1 + 3 * i:4 + 3 * i]
+        result[metric] = {"mean": mean, "min": low, "max": high}
+    return result
+
+# === CLI ===
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Session statistics in SQLite.")
+    parser.add_argument("--db", default=DB_FILE)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    importer = commands.add_parser("import", help="import the new rows of a stats CSV")
+    importer.add_argument("csv", nargs="?", default=CSV_FILE)
+
+    window = argparse.ArgumentParser(add_help=False)
+    window.add_argument("--since", help="first timestamp, e.g. 2025-05-01")
+    window.add_argument("--until", help="timestamp to stop before")
+    window.add_argument("--min-survival", type=float, help="only sessions at least this long (s)")
+
+    top = commands.add_parser("top", parents=[window], help="top-K leaderboard")
+    top.add_argument("-k", type=int, default=10)
+    top.add_argument("--by", default="Score", choices=METRICS)
+
+    summary = commands.add_parser("summary", parents=[window], help="aggregates over a window")
+    summary.add_argument("--metric", action="append", choices=METRICS,
+                         help="metric to aggregate (repeatable, default: all)")
+    args = parser.parse_args(argv)
+
+    if args.command == "import":
+        added, skipped = import_csv(args.csv, args.db)
+        note = f" (skipped the first {skipped} bytes, imported before)" if skipped else ""
+        print(f"{added} rows added -> {args.db}{note}")
+        return
+
+    conn = connect(args.db)
+    try:
+        if args.command == "top":
+            rows = top_sessions(conn, args.k, args.by, args.since, args.until, args.min_survival)
+            for rank, row in enumerate(rows, 1):
+                print(f"{rank:>3}. {row[args.by]:>10}  {row['SessionID']}  {row['Timestamp']}")
+        else:
+            result = aggregate(conn, args.metric or METRICS, args.since, args.until,
+                               args.min_survival)
+            print(json.dumps(result, indent=2))
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,26 +1,27 @@
 # === stat_logger.py ===
+import atexit
 import csv
 import os
+import queue
+import sqlite3
+import threading
+import time
 from datetime import datetime
 
 CSV_FILE = "gamedata.csv"
+FLUSH_INTERVAL_SEC = 2.0  # queued rows reach the file at most this late
+BATCH_SIZE = 256  # or as soon as this many are waiting
+DB_SUFFIXES = (".db", ".sqlite", ".sqlite3")  # stats files that use stats_db.py
 FIELDNAMES = [
     "Timestamp", "SessionID", "DistanceTraveled", "ShotsFired", "ShotsHit",
     "PowerUpsUsed", "SurvivalTime", "EnemiesDefeated", "Score",
     "PowerUpEffectiveness", "EnemiesDefeatedPerMinute", "AccuracyPerMinute"
 ]
 
-def init_csv():
-    if not os.path.exists(CSV_FILE):
-        with open(CSV_FILE, "w", newline="") as f:
-            writer = csv.DictWriter(f, fieldnames=FIELDNAMES)
-            writer.writeheader()
-
-def log_stats(session_id, distance, shots_fired, shots_hit, powerups_used,
-              survival_time, enemies_defeated, score,
-              powerup_effectiveness=0, edpm=0, accuracy_per_min=0):
-    init_csv()
-    row = {
+def make_row(session_id, distance, shots_fired, shots_hit, powerups_used,
+             survival_time, enemies_defeated, score,
+             powerup_effectiveness=0, edpm=0, accuracy_per_min=0):
+    return {
         "Timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
         "SessionID": session_id,
         "DistanceTraveled": distance,
@@ -35,6 +36,136 @@ def log_stats(session_id, distance, shots_fired, shots_hit, powerups_used,
         "AccuracyPerMinute": accuracy_per_min
     }
 
-    with open(CSV_FILE, "a", newline="") as f:
+# === Buffered Writer ===
+
+_STOP = object()
+
+class StatsWriter:
+    # Appends rows to a CSV on a daemon thread so callers never touch the
+    # file: rows are queued, then written in batches (one open, one fsync)
+    # every FLUSH_INTERVAL_SEC, once BATCH_SIZE are waiting, or on close
+    def __init__(self, path=CSV_FILE, interval=FLUSH_INTERVAL_SEC, batch_size=BATCH_SIZE):
+        self.path = path
+        self.interval = interval
+        self.batch_size = batch_size
+        self.queue = queue.Queue()
+        self.rows_written = 0
+        self.closed = False
+        self._thread = threading.Thread(target=self._run, name="stats-writer", daemon=True)
+        self._thread.start()
+
+    def write(self, row):
+        self.queue.put(row)
+
+    def write_many(self, rows):
+        # Bulk API: one queue item however many rows
+        self.queue.put(list(rows))
+
+    def flush(self, timeout=None):
+        # Block until every row queued so far is on disk. Once closed there
+        # is no thread to answer, so just wait for close() to finish writing
+        if self.closed:
+            self._thread.join(timeout)
+            return not self._thread.is_alive()
+        done = threading.Event()
+        self.queue.put(done)
+        return done.wait(timeout)
+
+    def close(self, timeout=None):
+        # Write what is left and stop the thread (idempotent)
+        if self.closed:
+            return
+        self.closed = True
+        self.queue.put(_STOP)
+        self._thread.join(timeout)
+
+    def _run(self):
+        pending = []
+        deadline = None
+        while True:
+            timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+            try:
+                item = self.queue.get(timeout=timeout)
+            except queue.Empty:
+                item = None  # interval elapsed
+
+            if isinstance(item, list):
+                pending.extend(item)
+            elif isinstance(item, dict):
+                pending.append(item)
+            if pending and deadline is None:
+                deadline = time.monotonic() + self.interval
+
+            if item is None or item is _STOP or isinstance(item, threading.Event) \
+                    or len(pending) >= self.batch_size:
+                if pending and self._append(pending):
+                    pending = []
+                deadline = time.monotonic() + self.interval if pending else None
+            if isinstance(item, threading.Event):
+                item.set()
+            elif item is _STOP:
+                return
+
+    def _append(self, rows):
+        # Rows stay queued for the next attempt if the file cannot be written
+        try:
+            append_rows(self.path, rows)
+        except (OSError, sqlite3.Error) as error:
+            print(f"[WARNING] Could not write stats to {self.path}: {error}")
+            return False
+        self.rows_written += len(rows)
+        return True
+
+_writer = None
+_stats_file = CSV_FILE
+
+def use_file(path):
+    # Where log_stats() writes from now on; a .db/.sqlite path selects the
+    # SQLite backend (stats_db.py) instead of CSV
+    global _stats_file
+    if _writer is not None and _writer.path != path:
+        _writer.close()
+    _stats_file = path
+
+def get_writer():
+    # Shared writer, started on first use and closed at exit
+    global _writer
+    if _writer is None or _writer.closed:
+        _writer = StatsWriter(_stats_file)
+        atexit.register(_writer.close)
+    return _writer
+
+def close():
+    if _writer is not None:
+        _writer.close()
+
+def log_stats(session_id, distance, shots_fired, shots_hit, powerups_used,
+              survival_time, enemies_defeated, score,
+              powerup_effectiveness=0, edpm=0, accuracy_per_min=0):
+    # Queued for the background writer; returns without touching the file
+    row = make_row(session_id, distance, shots_fired, shots_hit, powerups_used,
+                   survival_time, enemies_defeated, score,
+                   powerup_effectiveness, edpm, accuracy_per_min)
+    get_writer().write(row)
+
+def log_rows(rows):
+    # Queue many rows (e.g. a headless batch) for the background writer
+    get_writer().write_many(rows)
+
+def append_rows(path, rows):
+    # Append rows to a CSV or (for .db/.sqlite paths) a SQLite stats file
+    if path.endswith(DB_SUFFIXES):
+        import stats_db  # imports this module for FIELDNAMES
+        stats_db.append_rows(path, rows)
+    else:
+        write_rows(rows, path)
+
+def write_rows(rows, path=CSV_FILE):
+    # Append many rows at once, synchronously (header written if the file is new)
+    with open(path, "a", newline="") as f:
         writer = csv.DictWriter(f, fieldnames=FIELDNAMES)
-        writer.writerow(row)
+        if f.tell() == 0:
+            writer.writeheader()
+        writer.writerows(rows)
+        f.flush()
+        os.fsync(f.fileno())
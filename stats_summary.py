@@ -0,0 +1,176 @@
+# === stats_summary.py ===
+import argparse
+import json
+import numpy as np
+import pandas as pd
+from stats_logger import CSV_FILE, FIELDNAMES
+
+# Constants
+CHUNK_ROWS = 100000  # CSV rows parsed per chunk
+SAMPLE_SIZE = 100000  # reservoir size per metric (percentile accuracy vs. memory)
+PERCENTILES = (50, 95, 99)
+METRICS = [name for name in FIELDNAMES if name not in ("Timestamp", "SessionID")]
+
+# === Streaming Statistics ===
+
+
+class RunningStats:
+    # Count / mean / variance / min / max merged chunk by chunk (Chan et al.'s
+    # parallel form of Welford's update), so memory does not grow with rows
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0  # sum of squared deviations from the mean
+        self.min = np.inf
+        self.max = -np.inf
+
+    def add(self, values):
+        n = len(values)
+        if not n:
+            return
+        mean = values.mean()
+        m2 = ((values - mean) ** 2).sum()
+        total = self.count + n
+        delta = mean - self.mean
+        self.mean += delta * n / total
+        self.m2 += m2 + delta * delta * self.count * n / total
+        self.count = total
+        self.min = min(self.min, values.min())
+        self.max = max(self.max, values.max())
+
+    @property
+    def std(self):
+        # Sample standard deviation
+        return (self.m2 / (self.count - 1)) ** 0.5 if self.count > 1 else 0.0
+
+
+class Reservoir:
+    # Uniform fixed-size sample of everything seen (Algorithm R, one chunk at a
+    # time); percentiles of the sample approximate those of the whole stream
+    def __init__(self, size=SAMPLE_SIZE, rng=None):
+        self.size = size
+        self.sample = np.empty(size)
+        self.seen = 0
+        self.rng = rng if rng is not None else np.random.default_rng()
+
+    def add(self, values):
+        n = len(values)
+        # Fill the reservoir first
+        fill = min(max(self.size - self.seen, 0), n)
+        self.sample[self.seen:self.seen + fill] = values[:fill]
+        rest = values[fill:]
+        if len(rest):
+            # Item number t (0-based) replaces a random slot with chance size/(t+1)
+            t = np.arange(self.seen + fill, self.seen + n)
+            slots = (self.rng.random(len(rest)) * (t + 1)).astype(np.int64)
+            chosen = slots < self.size
+            slots, picked = slots[chosen], rest[chosen]
+            # Where a slot is hit twice the later item wins, as in the serial form
+            last = len(slots) - 1 - np.unique(slots[::-1], return_index=True)[1]
+            self.sample[slots[last]] = picked[last]
+        self.seen += n
+
+    def percentiles(self, q=PERCENTILES):
+        kept = self.sample[:min(self.seen, self.size)]
+        if not len(kept):
+            return [None] * len(q)
+        return list(np.percentile(kept, q))
+
+# === Summary ===
+
+
+def read_chunks(path, chunk_rows=CHUNK_ROWS):
+    # Merged files may repeat the header line; those rows are dropped here and
+    # leave their chunk's columns as strings (see numeric())
+    for chunk in pd.read_csv(path, chunksize=chunk_rows, low_memory=False,
+                             dtype={"Timestamp": str, "SessionID": str}):
+        yield chunk[chunk["Timestamp"].notna() & (chunk["Timestamp"] != "Timestamp")]
+
+
+def numeric(column):
+    # Finite values of a column (blank or malformed cells are skipped)
+    if column.dtype == object:
+        column = pd.to_numeric(column, errors="coerce")
+    values = column.to_numpy(dtype=float)
+    return values[np.isfinite(values)]
+
+
+def summarize(path=CSV_FILE, metrics=METRICS, since=None, until=None,
+              chunk_rows=CHUNK_ROWS, sample_size=SAMPLE_SIZE, seed=0):
+    # One pass over the CSV; only [since, until) rows count (timestamps are
+    # "YYYY-MM-DD HH:MM:SS", so plain string comparison orders them)
+    rng = np.random.default_rng(seed)
+    stats = {metric: RunningStats() for metric in metrics}
+    samples = {metric: Reservoir(sample_size, rng) for metric in metrics}
+    rows = 0
+    first = last = None
+    for chunk in read_chunks(path, chunk_rows):
+        stamps = chunk["Timestamp"]
+        keep = np.ones(len(chunk), dtype=bool)
+        if since:
+            keep &= (stamps >= since).to_numpy()
+        if until:
+            keep &= (stamps < until).to_numpy()
+        chunk = chunk[keep]
+        if not len(chunk):
+            continue
+        rows += len(chunk)
+        low, high = chunk["Timestamp"].min(), chunk["Timestamp"].max()
+        first = low if first is None else min(first, low)
+        last = high if last is None else max(last, high)
+        for metric in metrics:
+            values = numeric(chunk[metric])
+            stats[metric].add(values)
+            samples[metric].add(values)
+
+    result = {"file": path, "rows": rows, "since": since, "until": until,
+              "first": first, "last": last, "metrics": {}}
+    for metric in metrics:
+        s = stats[metric]
+        entry = {"count": s.count, "mean": None, "std": None, "min": None, "max": None}
+        if s.count:
+            entry.update(mean=float(s.mean), std=float(s.std), min=float(s.min), max=float(s.max))
+        for q, value in zip(PERCENTILES, samples[metric].percentiles()):
+            entry[f"p{q}"] = None if value is None else float(value)
+        result["metrics"][metric] = entry
+    return result
+
+
+def print_summary(result):
+    print(f"{result['rows']} sessions in {result['file']} ({result['first']} .. {result['last']})")
+    header = ["count", "mean", "std", "min", "max"] + [f"p{q}" for q in PERCENTILES]
+    print(f"{'metric':<26}" + "".join(f"{name:>12}" for name in header))
+    for metric, entry in result["metrics"].items():
+        cells = [f"{entry[name]:>12.2f}" if entry[name] is not None else f"{'-':>12}"
+                 for name in header[1:]]
+        print(f"{metric:<26}{entry['count']:>12}" + "".join(cells))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="One-pass, constant-memory summary of a (possibly huge) stats CSV.")
+    parser.add_argument("csv", nargs="?", default=CSV_FILE)
+    parser.add_argument("--since", help="first timestamp to include, e.g. 2025-05-01")
+    parser.add_argument("--until", help="timestamp to stop before")
+    parser.add_argument("--metric", action="append", choices=METRICS,
+                        help="metric to summarize (repeatable, default: all)")
+    parser.add_argument("--chunk-rows", type=int, default=CHUNK_ROWS)
+    parser.add_argument("--sample-size", type=int, default=SAMPLE_SIZE,
+                        help="reservoir size per metric for the percentiles")
+    parser.add_argument("--seed", type=int, default=0, help="reservoir sampling seed")
+    parser.add_argument("--json", metavar="PATH", help="write the summary as JSON ('-' for stdout)")
+    args = parser.parse_args(argv)
+
+    result = summarize(args.csv, args.metric or METRICS, args.since, args.until,
+                       args.chunk_rows, args.sample_size, args.seed)
+    if args.json == "-":
+        print(json.dumps(result, indent=2))
+        return
+    print_summary(result)
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(result, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
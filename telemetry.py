@@ -0,0 +1,183 @@
+# === telemetry.py ===
+import argparse
+import json
+import os
+import struct
+import threading
+import numpy as np
+from enemy import ENEMY_TYPES
+from powerup import POWERUP_TYPES
+from timestep import LOGIC_HZ
+
+# Constants
+MAGIC = b"PTEL"
+VERSION = 1
+RING_CAPACITY = 8192  # events buffered between writes
+FLUSH_INTERVAL_SEC = 0.5  # how often the writer thread drains the ring
+
+# One fixed-size (14 byte) little-endian record per event
+EVENT_DTYPE = np.dtype([
+    ("tick", "<u4"),  # fixed simulation step the event happened in
+    ("kind", "u1"),  # KINDS value
+    ("detail", "u1"),  # enemy / power-up type index, damage source, ...
+    ("x", "<i2"),  # where it happened (pixels)
+    ("y", "<i2"),
+    ("value", "<i4"),  # damage, score, minute, ...
+])
+
+# Event kinds (detail / value meaning)
+KINDS = {
+    "shot_fired": 1,  # detail: weapon (WEAPONS), value: projectiles launched
+    "hit": 2,  # detail: enemy type, value: damage
+    "enemy_spawned": 3,  # detail: enemy type, value: health
+    "enemy_killed": 4,  # detail: enemy type, value: score
+    "powerup_dropped": 5,  # detail: power-up type
+    "powerup_collected": 6,  # detail: power-up type
+    "damage_taken": 7,  # detail: source (DAMAGE_SOURCES), value: health left
+    "difficulty_step": 8,  # value: minutes survived
+}
+WEAPONS = ("cannon", "shotgun", "missile")
+DAMAGE_SOURCES = ("contact", "projectile")
+ENEMY_NAMES = tuple(data["name"] for data in ENEMY_TYPES)
+POWERUP_NAMES = tuple(POWERUP_TYPES)
+
+# === Writer ===
+
+
+class NullTelemetry:
+    # Default for sessions that are not recording telemetry
+    def record(self, tick, kind, detail=0, value=0, x=0, y=0):
+        pass
+
+    def close(self):
+        pass
+
+
+class TelemetryWriter:
+    # The game thread only fills slots of a preallocated ring buffer; a daemon
+    # thread appends the filled part to the file every FLUSH_INTERVAL_SEC (or
+    # once the ring is half full). If the writer falls a whole ring behind,
+    # new events are counted as dropped instead of blocking the game
+    def __init__(self, path, session=None, capacity=RING_CAPACITY, interval=FLUSH_INTERVAL_SEC):
+        self.ring = np.zeros(capacity, dtype=EVENT_DTYPE)
+        self.capacity = capacity
+        self.interval = interval
+        self.head = 0  # events recorded so far (next slot is head % capacity)
+        self.tail = 0  # events written to the file so far
+        self.dropped = 0
+        self.closed = False
+
+        self.file = open(path, "wb")
+        header = json.dumps({
+            "version": VERSION,
+            "dtype": EVENT_DTYPE.descr,
+            "logic_hz": LOGIC_HZ,
+            "kinds": KINDS,
+            "weapons": WEAPONS,
+            "damage_sources": DAMAGE_SOURCES,
+            "enemy_types": ENEMY_NAMES,
+            "powerup_types": POWERUP_NAMES,
+            "session": session or {},
+        }).encode()
+        self.file.write(MAGIC + struct.pack("<I", len(header)) + header)
+
+        self._wake = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="telemetry", daemon=True)
+        self._thread.start()
+
+    def record(self, tick, kind, detail=0, value=0, x=0, y=0):
+        head = self.head
+        pending = head - self.tail
+        if pending >= self.capacity:
+            self.dropped += 1
+            return
+        self.ring[head % self.capacity] = (tick, kind, detail, x, y, value)
+        self.head = head + 1  # publish after the slot is filled
+        if pending == self.capacity // 2:
+            self._wake.set()
+
+    def _drain(self):
+        # Append [tail, head) to the file (in two slices if it wraps)
+        head, tail = self.head, self.tail
+        if head == tail:
+            return
+        start, end = tail % self.capacity, head % self.capacity
+        if start < end:
+            self.file.write(self.ring[start:end].tobytes())
+        else:
+            self.file.write(self.ring[start:].tobytes())
+            self.file.write(self.ring[:end].tobytes())
+        self.file.flush()
+        self.tail = head
+
+    def _run(self):
+        while not self.closed:
+            self._wake.wait(self.interval)
+            self._wake.clear()
+            self._drain()
+
+    def close(self):
+        # Write what is left and close the file (idempotent)
+        if self.closed:
+            return
+        self.closed = True
+        self._wake.set()
+        self._thread.join()
+        self._drain()
+        os.fsync(self.file.fileno())
+        self.file.close()
+
+# === Reader ===
+
+
+def read_events(path):
+    # (header, structured array of events). A record cut short by a crash
+    # mid-write is ignored
+    with open(path, "rb") as f:
+        if f.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"{path} is not a telemetry file")
+        (length,) = struct.unpack("<I", f.read(4))
+        header = json.loads(f.read(length))
+        if header["version"] != VERSION:
+            raise ValueError(f"unsupported telemetry version {header['version']}")
+        data = f.read()
+    count = len(data) // EVENT_DTYPE.itemsize
+    events = np.frombuffer(data, dtype=EVENT_DTYPE, count=count)
+    return header, events
+
+
+def columns(events):
+    # One plain array per field, plus the event time in seconds
+    arrays = {name: np.ascontiguousarray(events[name]) for name in EVENT_DTYPE.names}
+    arrays["time"] = arrays["tick"] / LOGIC_HZ
+    return arrays
+
+
+def of_kind(events, kind):
+    return events[events["kind"] == KINDS[kind]]
+
+
+def print_summary(header, events):
+    seconds = events["tick"][-1] / header["logic_hz"] if len(events) else 0
+    print(f"{len(events)} events over {seconds:.1f}s of game time")
+    for name, kind in header["kinds"].items():
+        print(f"  {name:<18}{np.count_nonzero(events['kind'] == kind):>8}")
+    kills = of_kind(events, "enemy_killed")
+    for index, name in enumerate(header["enemy_types"]):
+        print(f"  killed {name:<11}{np.count_nonzero(kills['detail'] == index):>8}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Decode a telemetry event file.")
+    parser.add_argument("path")
+    parser.add_argument("--npz", metavar="PATH", help="also save the decoded columns here")
+    args = parser.parse_args(argv)
+
+    header, events = read_events(args.path)
+    print_summary(header, events)
+    if args.npz:
+        np.savez(args.npz, **columns(events))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,32 @@
+# === timestep.py ===
+
+# Game rules advance in fixed steps independent of the render rate; the
+# renderer draws between the last two steps using the leftover fraction
+LOGIC_HZ = 120  # simulation steps per second
+TICK_DT = 1 / LOGIC_HZ  # seconds per simulation step
+
+
+class FixedTimestep:
+    def __init__(self, dt=TICK_DT):
+        self.dt = dt
+        self.accumulator = 0.0
+
+    def add(self, frame_time):
+        # Bank one rendered frame's worth of real (or recorded) time
+        self.accumulator += frame_time
+
+    def steps(self):
+        # Yield once per whole step banked; the step is consumed before
+        # yielding, so breaking out early leaves the remainder banked
+        while self.accumulator >= self.dt:
+            self.accumulator -= self.dt
+            yield self.dt
+
+    @property
+    def alpha(self):
+        # Fraction of a step since the last update (0..1), for interpolation
+        return self.accumulator / self.dt
+
+
+def interpolate(previous, current, alpha):
+    return previous + (current - previous) * alpha
@@ -1,57 +1,234 @@
 # === visualizations.py ===
+import argparse
+import hashlib
+import io
+import json
+import multiprocessing
+import os
+import time
+import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
-
-# Load and sort
-df = pd.read_csv("gamedata.csv", parse_dates=["Timestamp"])
-df = df.sort_values("Timestamp").reset_index(drop=True)
-
-# use session number instead of timestamp
-df["Session"] = range(1, len(df) + 1)
-
-plt.style.use("ggplot")
-fig, axs = plt.subplots(3, 2, figsize=(18, 12))
-fig.suptitle("Gameplay Statistics Visualization", fontsize=20, fontweight="bold")
-
-# === Graph 1: Player Movement Distance ===
-axs[0, 0].plot(df["Session"], df["DistanceTraveled"], marker='o', color='tab:blue')
-axs[0, 0].set_title("Player Movement Distance")
-axs[0, 0].set_xlabel("Session")
-axs[0, 0].set_ylabel("Distance")
-axs[0, 0].set_ylim(0, df["DistanceTraveled"].max() + 500)
-
-# === Graph 2: Power-up Usage ===
-axs[0, 1].bar(df["Session"], df["PowerUpsUsed"], color='tab:green')
-axs[0, 1].set_title("Power-up Usage per Session")
-axs[0, 1].set_xlabel("Session")
-axs[0, 1].set_ylabel("Times Collected")
-
-# === Graph 3: Enemies Defeated Histogram ===
-axs[1, 0].hist(df["EnemiesDefeated"], bins=8, color='tab:orange', edgecolor='black')
-axs[1, 0].set_title("Enemies Defeated per Session")
-axs[1, 0].set_xlabel("Enemies Defeated")
-axs[1, 0].set_ylabel("Session Count")
-
-# === Graph 4: Power-up Effectiveness Histogram ===
-axs[1, 1].hist(df["PowerUpEffectiveness"], bins=10, color='tab:red', edgecolor='black')
-axs[1, 1].set_title("Power-up Effectiveness per Session")
-axs[1, 1].set_xlabel("Effectiveness (Score / Uses)")
-axs[1, 1].set_ylabel("Session Count")
-
-# === Graph 5: Enemies Defeated Per Minute ===
-axs[2, 0].plot(df["Session"], df["EnemiesDefeatedPerMinute"], marker='o', color='tab:purple')
-axs[2, 0].set_title("Enemies Defeated Per Minute Over Time")
-axs[2, 0].set_xlabel("Session")
-axs[2, 0].set_ylabel("Enemies/Min")
-axs[2, 0].set_ylim(0, df["EnemiesDefeatedPerMinute"].max() + 2)
-
-# === Graph 6: Accuracy Over Time ===
-axs[2, 1].plot(df["Session"], df["AccuracyPerMinute"], marker='o', color='tab:brown')
-axs[2, 1].set_title("Accuracy Over Time")
-axs[2, 1].set_xlabel("Session")
-axs[2, 1].set_ylabel("Accuracy (%)")
-axs[2, 1].set_ylim(0, 100)
-
-plt.tight_layout(rect=[0, 0.03, 1, 0.95])
-plt.subplots_adjust(hspace=0.5)
-plt.show()
+
+# Constants
+CSV_PATH = "gamedata.csv"
+CACHE_SUFFIX = ".cache.npz"  # parsed columns live next to the CSV
+CACHE_VERSION = 1
+FINGERPRINT_BYTES = 4096  # bytes hashed at each end of the parsed prefix
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+STYLE = "ggplot"
+
+# === Parsed-Data Cache ===
+
+
+def parse_csv(data, names=None):
+    # Parse CSV bytes (with a header unless names are given)
+    frame = pd.read_csv(io.BytesIO(data), header=None if names else "infer", names=names)
+    frame["Timestamp"] = pd.to_datetime(frame["Timestamp"], format=TIMESTAMP_FORMAT)
+    return frame
+
+
+def fingerprint(f, length):
+    # Hash of both ends of the first `length` bytes, so a rewritten (rather
+    # than appended) file is noticed without reading all of it
+    f.seek(0)
+    head = f.read(min(FINGERPRINT_BYTES, length))
+    f.seek(max(0, length - FINGERPRINT_BYTES))
+    tail = f.read(min(FINGERPRINT_BYTES, length))
+    return hashlib.sha1(head + tail).hexdigest()
+
+
+def read_lines(f, start):
+    # Complete lines from start on (a half-written last line waits for next time)
+    f.seek(start)
+    data = f.read()
+    return data[:data.rfind(b"\n") + 1]
+
+
+def read_cache(cache_path):
+    try:
+        with np.load(cache_path) as cached:
+            meta = json.loads(str(cached["meta"]))
+            if meta.get("version") != CACHE_VERSION:
+                return None, None
+            frame = pd.DataFrame({name: cached[name] for name in meta["columns"]})
+    except (OSError, KeyError, ValueError):
+        return None, None
+    return meta, frame
+
+
+def write_cache(cache_path, meta, frame):
+    # Columns as plain arrays (no pickles); written aside, then swapped in
+    arrays = {name: frame[name].to_numpy() for name in frame.columns}
+    arrays["SessionID"] = arrays["SessionID"].astype(str)
+    arrays["Timestamp"] = arrays["Timestamp"].astype("datetime64[s]")
+    meta = dict(meta, version=CACHE_VERSION, columns=list(frame.columns))
+    temp_path = cache_path + ".tmp"
+    with open(temp_path, "wb") as f:
+        np.savez(f, meta=np.array(json.dumps(meta)), **arrays)
+    os.replace(temp_path, cache_path)
+
+
+def load_stats(path=CSV_PATH, use_cache=True):
+    # Parsed rows in file order. The cache is keyed by the CSV's size and
+    # mtime; when the file only grew, just the appended rows are parsed
+    stat = os.stat(path)
+    cache_path = path + CACHE_SUFFIX
+    meta, frame = read_cache(cache_path) if use_cache else (None, None)
+    if meta and meta["size"] == stat.st_size and meta["mtime"] == stat.st_mtime_ns:
+        return frame
+
+    with open(path, "rb") as f:
+        if meta and meta["offset"] <= stat.st_size \
+                and fingerprint(f, meta["offset"]) == meta["fingerprint"]:
+            tail = read_lines(f, meta["offset"])
+            if tail.strip():
+                frame = pd.concat([frame, parse_csv(tail, meta["columns"])], ignore_index=True)
+            end = meta["offset"] + len(tail)
+        else:
+            data = read_lines(f, 0)
+            frame = parse_csv(data)
+            end = len(data)
+        if use_cache:
+            write_cache(cache_path, {"size": stat.st_size, "mtime": stat.st_mtime_ns,
+                                     "offset": end, "fingerprint": fingerprint(f, end)}, frame)
+    return frame
+
+
+def prepare(frame):
+    # Sort and use session number instead of timestamp
+    df = frame.sort_values("Timestamp", kind="stable").reset_index(drop=True)
+    df["Session"] = range(1, len(df) + 1)
+    return df
+
+# === Charts ===
+
+
+def plot_distance(ax, df):
+    # === Graph 1: Player Movement Distance ===
+    ax.plot(df["Session"], df["DistanceTraveled"], marker='o', color='tab:blue')
+    ax.set_title("Player Movement Distance")
+    ax.set_xlabel("Session")
+    ax.set_ylabel("Distance")
+    ax.set_ylim(0, df["DistanceTraveled"].max() + 500)
+
+
+def plot_powerups(ax, df):
+    # === Graph 2: Power-up Usage ===
+    ax.bar(df["Session"], df["PowerUpsUsed"], color='tab:green')
+    ax.set_title("Power-up Usage per Session")
+    ax.set_xlabel("Session")
+    ax.set_ylabel("Times Collected")
+
+
+def plot_kills(ax, df):
+    # === Graph 3: Enemies Defeated Histogram ===
+    ax.hist(df["EnemiesDefeated"], bins=8, color='tab:orange', edgecolor='black')
+    ax.set_title("Enemies Defeated per Session")
+    ax.set_xlabel("Enemies Defeated")
+    ax.set_ylabel("Session Count")
+
+
+def plot_effectiveness(ax, df):
+    # === Graph 4: Power-up Effectiveness Histogram ===
+    ax.hist(df["PowerUpEffectiveness"], bins=10, color='tab:red', edgecolor='black')
+    ax.set_title("Power-up Effectiveness per Session")
+    ax.set_xlabel("Effectiveness (Score / Uses)")
+    ax.set_ylabel("Session Count")
+
+
+def plot_kill_rate(ax, df):
+    # === Graph 5: Enemies Defeated Per Minute ===
+    ax.plot(df["Session"], df["EnemiesDefeatedPerMinute"], marker='o', color='tab:purple')
+    ax.set_title("Enemies Defeated Per Minute Over Time")
+    ax.set_xlabel("Session")
+    ax.set_ylabel("Enemies/Min")
+    ax.set_ylim(0, df["EnemiesDefeatedPerMinute"].max() + 2)
+
+
+def plot_accuracy(ax, df):
+    # === Graph 6: Accuracy Over Time ===
+    ax.plot(df["Session"], df["AccuracyPerMinute"], marker='o', color='tab:brown')
+    ax.set_title("Accuracy Over Time")
+    ax.set_xlabel("Session")
+    ax.set_ylabel("Accuracy (%)")
+    ax.set_ylim(0, 100)
+
+
+# Dashboard order (row by row); names are also the PNG file names
+CHARTS = {
+    "distance": plot_distance,
+    "powerups": plot_powerups,
+    "kills": plot_kills,
+    "effectiveness": plot_effectiveness,
+    "kill_rate": plot_kill_rate,
+    "accuracy": plot_accuracy,
+}
+
+# === Rendering ===
+
+
+def show_dashboard(df):
+    # Interactive window with all six charts (the default)
+    import matplotlib.pyplot as plt
+
+    plt.style.use(STYLE)
+    fig, axs = plt.subplots(3, 2, figsize=(18, 12))
+    fig.suptitle("Gameplay Statistics Visualization", fontsize=20, fontweight="bold")
+    for ax, plot in zip(axs.flat, CHARTS.values()):
+        plot(ax, df)
+    plt.tight_layout(rect=[0, 0.03, 1, 0.95])
+    plt.subplots_adjust(hspace=0.5)
+    plt.show()
+
+
+def render_chart(job):
+    # One chart to one PNG with the Agg canvas (no window, no pyplot state)
+    import matplotlib.style
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    name, df, out_dir = job
+    with matplotlib.style.context(STYLE):
+        fig = Figure(figsize=(9, 4))
+        FigureCanvasAgg(fig)
+        CHARTS[name](fig.add_subplot(), df)
+        fig.tight_layout()
+        path = os.path.join(out_dir, f"{name}.png")
+        fig.savefig(path)
+    return path
+
+
+def render_charts(df, out_dir, names=None, workers=None):
+    # Each chart renders in its own process
+    os.makedirs(out_dir, exist_ok=True)
+    jobs = [(name, df, out_dir) for name in names or CHARTS]
+    context = multiprocessing.get_context("spawn")
+    with context.Pool(min(workers or os.cpu_count(), len(jobs))) as pool:
+        return pool.map(render_chart, jobs)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Gameplay statistics charts.")
+    parser.add_argument("csv", nargs="?", default=CSV_PATH)
+    parser.add_argument("--out", metavar="DIR",
+                        help="write one PNG per chart here instead of opening a window")
+    parser.add_argument("--chart", action="append", choices=sorted(CHARTS),
+                        help="chart to render with --out (repeatable, default: all)")
+    parser.add_argument("--workers", type=int, help="render processes (default: all cores)")
+    parser.add_argument("--no-cache", action="store_true",
+                        help=f"always re-parse the CSV (and leave the {CACHE_SUFFIX} file alone)")
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    df = prepare(load_stats(args.csv, use_cache=not args.no_cache))
+    if not args.out:
+        show_dashboard(df)
+        return
+    parsed = time.perf_counter()
+    paths = render_charts(df, args.out, args.chart, args.workers)
+    print(f"{len(df)} sessions, {len(paths)} charts -> {args.out} "
+          f"(load {parsed - started:.2f}s, render {time.perf_counter() - parsed:.2f}s)")
+
+
+if __name__ == "__main__":
+    main()